@@ -1,29 +1,65 @@
-from flask import Flask, render_template, request, redirect, url_for, flash, jsonify, session
+from flask import Flask, render_template, request, redirect, url_for, flash, jsonify, session, g, copy_current_request_context
+from flask.json.provider import JSONProvider
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import bindparam, event, func
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import joinedload, selectinload
 from flask_login import LoginManager, UserMixin, login_user, login_required, logout_user, current_user
 from flask_mail import Mail, Message
+from flask_session import Session
+from flask_caching import Cache
+from werkzeug.exceptions import HTTPException
 from werkzeug.security import generate_password_hash, check_password_hash
 import os
 import re
+import sqlite3
+import time
+import copy
 from datetime import datetime, timedelta
 import json
+import logging
+import uuid
+from email.parser import BytesParser
+import orjson
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import heapq
+from operator import itemgetter
+from threading import Lock
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import spotipy
 from spotipy.oauth2 import SpotifyOAuth
+from spotipy.cache_handler import MemoryCacheHandler
 from dotenv import load_dotenv
-import google.generativeai as genai
-from thefuzz import fuzz, process
-from groq import Groq
-from ytmusicapi import YTMusic
+from rapidfuzz import fuzz, process
+from rapidfuzz.utils import default_process
 
 # Load environment variables
 load_dotenv()
 
-# Configure Gemini API 
+# Per-track tracing in the title extraction helpers goes through the logger at DEBUG level, so the
+# messages are only formatted when LOG_LEVEL=DEBUG
+logging.basicConfig(level=os.getenv('LOG_LEVEL', 'INFO'), format='%(message)s')
+logger = logging.getLogger(__name__)
+
+# Sync debugging trail shown by /debug_logs - one file handler kept open for the process instead of
+# reopening the file for every line; set SYNC_DEBUG_LOG_LEVEL=INFO to turn it off
+SYNC_DEBUG_LOG_PATH = '/tmp/sync_debug.log'
+sync_debug_log = logging.getLogger('sync_debug')
+sync_debug_log.setLevel(os.getenv('SYNC_DEBUG_LOG_LEVEL', 'DEBUG'))
+sync_debug_log.propagate = False
+_sync_debug_handler = logging.FileHandler(SYNC_DEBUG_LOG_PATH, delay=True)
+_sync_debug_handler.setFormatter(logging.Formatter('%(message)s'))
+sync_debug_log.addHandler(_sync_debug_handler)
+
+# Configure Gemini API (the SDK itself is imported on first use, see get_genai)
 GEMINI_API_KEY = os.getenv('GEMINI_API_KEY')
 # Note: Gemini quota tracking moved to user-specific session storage
 
 if GEMINI_API_KEY:
-    genai.configure(api_key=GEMINI_API_KEY)
     print(f"SUCCESS: Gemini API configured with key: {GEMINI_API_KEY[:10]}...")
 
 # Configure Groq API
@@ -33,13 +69,149 @@ if GROQ_API_KEY:
 else:
     print("WARNING: Groq API key not found - will use fallback parsing only")
 
-# Initialize YouTube Music API
-try:
-    ytmusic = YTMusic()
-    print("SUCCESS: YouTube Music API initialized successfully")
-except Exception as e:
-    print(f"WARNING: YouTube Music API initialization failed: {e}")
-    ytmusic = None
+# Shared HTTP session for the YouTube Music, Spotify and YouTube Data API calls - pooled keep-alive
+# connections avoid a fresh TLS handshake on every API call
+http_session = requests.Session()
+http_session.mount('https://', HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=32,
+    # Retries idempotent requests on rate limiting / server errors, honoring Retry-After; the last
+    # response is still returned (not raised) so callers keep checking status_code themselves
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504], raise_on_status=False)
+))
+
+def spotify_client(access_token):
+    """Create a Spotify client that reuses the shared HTTP connection pool"""
+    return spotipy.Spotify(auth=access_token, requests_session=http_session)
+
+# Spotify track search results keyed by (normalized query, limit) - the same queries repeat
+# across the search strategies of a sync and across syncs, and results do not depend on the user
+SPOTIFY_SEARCH_CACHE_SIZE = 4096
+spotify_search_cache = OrderedDict()
+spotify_search_cache_lock = Lock()
+
+def trim_spotify_track(track):
+    """Keep only the track fields the app reads (they also end up in the session for pending tracks)"""
+    return {
+        'id': track.get('id'),
+        'name': track.get('name', ''),
+        'uri': track.get('uri'),
+        'duration_ms': track.get('duration_ms', 0),
+        'artists': [{'id': artist.get('id'), 'name': artist.get('name', '')} for artist in track.get('artists') or []],
+        'album': {'id': (track.get('album') or {}).get('id'), 'name': (track.get('album') or {}).get('name', '')}
+    }
+
+def search_spotify_tracks(sp, query, limit=1):
+    """Search Spotify tracks, memoized per query; returns the same shape as sp.search"""
+    key = (' '.join(query.lower().split()), limit)
+    with spotify_search_cache_lock:
+        items = spotify_search_cache.get(key)
+        if items is not None:
+            spotify_search_cache.move_to_end(key)
+    
+    if items is None:
+        results = sp.search(q=query, type='track', limit=limit)
+        items = tuple(trim_spotify_track(track) for track in results['tracks']['items'] if track)
+        with spotify_search_cache_lock:
+            spotify_search_cache[key] = items
+            if len(spotify_search_cache) > SPOTIFY_SEARCH_CACHE_SIZE:
+                spotify_search_cache.popitem(last=False)
+    
+    # Callers may keep or modify the tracks, so they get copies
+    return {'tracks': {'items': [copy.deepcopy(track) for track in items]}}
+
+# The AI and YouTube Music SDKs are heavy to import, so they are loaded on first use
+# instead of at startup - workers that only serve auth or dashboard pages never pay for them
+@lru_cache(maxsize=1)
+def get_ytmusic():
+    """Initialize the YouTube Music API on first use (None if initialization fails)"""
+    try:
+        from ytmusicapi import YTMusic
+        ytmusic = YTMusic(requests_session=http_session)
+        print("SUCCESS: YouTube Music API initialized successfully")
+        return ytmusic
+    except Exception as e:
+        print(f"WARNING: YouTube Music API initialization failed: {e}")
+        return None
+
+@lru_cache(maxsize=1)
+def get_genai():
+    """Import and configure the Gemini SDK on first use"""
+    import google.generativeai as genai
+    genai.configure(api_key=GEMINI_API_KEY)
+    return genai
+
+@lru_cache(maxsize=1)
+def get_groq():
+    """Create the Groq client on first use"""
+    from groq import Groq
+    return Groq(api_key=GROQ_API_KEY)
+
+# Gemini quota flags - kept per user in Redis when REDIS_URL is set (shared across workers),
+# otherwise in an in-process dict; either way the flag expires 24 hours after the quota was hit
+GEMINI_QUOTA_TTL_SECONDS = 24 * 60 * 60
+gemini_quota_expiry = {}
+# Extraction workers check and set the flag concurrently during a sync
+gemini_quota_lock = Lock()
+redis_client = None
+if os.getenv('REDIS_URL'):
+    try:
+        import redis
+        redis_client = redis.Redis.from_url(os.getenv('REDIS_URL'))
+        redis_client.ping()
+        print("SUCCESS: Redis connected for Gemini quota tracking")
+    except Exception as e:
+        print(f"WARNING: Redis unavailable, tracking Gemini quota in-process: {e}")
+        redis_client = None
+
+# Spotify accepts at most 100 track URIs per playlist_add_items call
+SPOTIFY_ADD_ITEMS_BATCH_SIZE = 100
+# The YouTube Data API batch endpoint accepts at most 50 sub-requests per call
+YOUTUBE_BATCH_URL = 'https://www.googleapis.com/batch/youtube/v3'
+YOUTUBE_BATCH_SIZE = 50
+
+# Rows written per INSERT while storing playlists, so statement size and pending rows stay bounded
+DB_WRITE_CHUNK_SIZE = 500
+
+# Maximum number of songs whose titles are extracted concurrently during a sync
+ENRICHMENT_MAX_WORKERS = int(os.getenv('ENRICHMENT_MAX_WORKERS', 8))
+# Playlists whose tracks are fetched concurrently when refreshing a user's playlists
+PLAYLIST_FETCH_MAX_WORKERS = int(os.getenv('PLAYLIST_FETCH_MAX_WORKERS', 8))
+# Concurrent YouTube Data API searches during cross-platform sync
+YOUTUBE_SEARCH_MAX_WORKERS = int(os.getenv('YOUTUBE_SEARCH_MAX_WORKERS', 8))
+# Client-side ceiling on YouTube Data API calls per second, shared by all sync threads
+YOUTUBE_API_RATE = float(os.getenv('YOUTUBE_API_RATE', 10))
+
+class LeakyBucket:
+    """Thread-safe rate limiter: tokens refill at `rate` per second up to `capacity`"""
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = Lock()
+
+    def acquire(self):
+        """Take one token, sleeping (outside the lock) until one is available"""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+youtube_rate_limiter = LeakyBucket(YOUTUBE_API_RATE, capacity=max(1, int(YOUTUBE_API_RATE)))
 
 def generate_captcha():
     """Generate a random CAPTCHA string with mixed case, numbers, and symbols"""
@@ -145,26 +317,33 @@ def send_otp_email(email, otp, user_name):
         print(f"Email sending error: {e}")
         return False
 
-def check_and_reset_gemini_quota():
-    """Check if 24 hours have passed since last quota reset and reset if needed - USER SPECIFIC"""
-    current_time = datetime.now()
-    
-    # Get user-specific quota status from session
-    quota_exceeded = session.get('gemini_quota_exceeded', False)
-    quota_reset_time = session.get('gemini_quota_reset_time')
-    
-    # If quota is exceeded and we haven't reset in 24 hours, reset it
-    if quota_exceeded and quota_reset_time:
-        time_since_reset = current_time - datetime.fromisoformat(quota_reset_time)
-        if time_since_reset.total_seconds() >= 24 * 60 * 60:  # 24 hours
-            session['gemini_quota_exceeded'] = False
-            session['gemini_quota_reset_time'] = current_time.isoformat()
-            print(f"RESET: Gemini quota automatically reset after 24 hours for user {current_user.user_id}")
-    
-    # If quota is exceeded but we haven't set a reset time, set it now
-    elif quota_exceeded and not quota_reset_time:
-        session['gemini_quota_reset_time'] = current_time.isoformat()
-        print(f"TIMER: Gemini quota exceeded - will auto-reset in 24 hours for user {current_user.user_id}")
+def gemini_quota_key():
+    """Redis key holding the current user's Gemini quota flag"""
+    return f"gemini_quota:{current_user.get_id()}"
+
+def is_gemini_quota_exceeded():
+    """Check the current user's Gemini quota flag - it expires on its own after 24 hours"""
+    key = gemini_quota_key()
+    if redis_client is not None:
+        try:
+            return bool(redis_client.exists(key))
+        except Exception as e:
+            print(f"WARNING: Redis quota check failed: {e}")
+    with gemini_quota_lock:
+        expires_at = gemini_quota_expiry.get(key)
+    return expires_at is not None and expires_at > datetime.now()
+
+def mark_gemini_quota_exceeded():
+    """Flag the current user's Gemini quota as exceeded for the next 24 hours"""
+    key = gemini_quota_key()
+    if redis_client is not None:
+        try:
+            redis_client.set(key, "1", ex=GEMINI_QUOTA_TTL_SECONDS)
+            return
+        except Exception as e:
+            print(f"WARNING: Redis quota update failed: {e}")
+    with gemini_quota_lock:
+        gemini_quota_expiry[key] = datetime.now() + timedelta(seconds=GEMINI_QUOTA_TTL_SECONDS)
 
 # ============================================================================
 # NEW SONG EXTRACTION SYSTEM - EXACT PRIORITY ORDER
@@ -175,71 +354,136 @@ def get_licensed_metadata(video_metadata):
     if not video_metadata:
         return None
     
-    # Check for "Licensed to YouTube by" metadata
-    if "licensed" in str(video_metadata).lower():
-        # Extract licensed information if available
+    # Check for "Licensed to YouTube by" metadata - only the licensed_info key is ever returned,
+    # so look it up directly instead of stringifying the whole metadata dict
+    licensed_info = video_metadata.get("licensed_info") if isinstance(video_metadata, dict) else None
+    if licensed_info:
         # This would need to be implemented based on how you get video metadata
-        print("MUSIC: Found licensed metadata")
-        return video_metadata.get("licensed_info")
+        logger.debug('MUSIC: Found licensed metadata')
+        return licensed_info
     
     return None
 
-def get_from_ytmusic(query):
-    """Step 2: YouTube Music API (ytmusicapi)"""
-    if not ytmusic:
-        print("WARNING: YouTube Music API not available")
-        return None
+YTMUSIC_CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
+
+YTMUSIC_SEARCH_CACHE_SIZE = 10000
+ytmusic_search_cache = OrderedDict()
+ytmusic_search_cache_lock = Lock()
+_CACHE_MISS = object()
+
+def _ytmusic_top_song(query):
+    """Search YouTube Music and return the top song as a (title, artist, album) tuple
     
-    try:
-        print(f"MUSIC: Searching YouTube Music for: '{query}'")
-        results = ytmusic.search(query, filter="songs")
+    Memoized per normalized title (case, brackets and spacing ignored) in-process, and in Redis for
+    7 days when configured, so different uploads of the same song share one lookup. The search
+    itself still uses the original query. Errors are not cached.
+    """
+    key = normalize_title(query)
+    with ytmusic_search_cache_lock:
+        result = ytmusic_search_cache.get(key, _CACHE_MISS)
+        if result is not _CACHE_MISS:
+            ytmusic_search_cache.move_to_end(key)
+            return result
+    
+    result = _CACHE_MISS
+    if redis_client is not None:
+        try:
+            cached = redis_client.get(f"ytmusic:{key}")
+            if cached is not None:
+                cached = json.loads(cached)
+                result = tuple(cached) if cached else None
+        except Exception as e:
+            logger.warning('Redis YouTube Music cache read failed: %s', e)
+    
+    if result is _CACHE_MISS:
+        results = get_ytmusic().search(query, filter="songs")
         
+        result = None
         if results and len(results) > 0:
             top = results[0]
             song_name = top.get('title', '').strip()
             artist_name = top.get('artists', [{}])[0].get('name', '').strip()
             
             if song_name and artist_name:
-                print(f"SUCCESS: YouTube Music found: '{song_name}' by '{artist_name}'")
-                return {
-                    'title': song_name,
-                    'artist': artist_name,
-                    'album': top.get('album', {}).get('name', ''),
-                    'source': 'ytmusic'
-                }
+                result = (song_name, artist_name, (top.get('album') or {}).get('name', ''))
         
-        print("❌ No good YouTube Music results found")
+        if redis_client is not None:
+            try:
+                redis_client.set(f"ytmusic:{key}", json.dumps(result), ex=YTMUSIC_CACHE_TTL_SECONDS)
+            except Exception as e:
+                logger.warning('Redis YouTube Music cache write failed: %s', e)
+    
+    with ytmusic_search_cache_lock:
+        ytmusic_search_cache[key] = result
+        if len(ytmusic_search_cache) > YTMUSIC_SEARCH_CACHE_SIZE:
+            ytmusic_search_cache.popitem(last=False)
+    return result
+
+def get_from_ytmusic(query):
+    """Step 2: YouTube Music API (ytmusicapi)"""
+    if not get_ytmusic():
+        logger.warning('YouTube Music API not available')
+        return None
+    
+    try:
+        logger.debug("MUSIC: Searching YouTube Music for: '%s'", query)
+        result = _ytmusic_top_song(query)
+        
+        if result:
+            song_name, artist_name, album_name = result
+            logger.debug("SUCCESS: YouTube Music found: '%s' by '%s'", song_name, artist_name)
+            return {
+                'title': song_name,
+                'artist': artist_name,
+                'album': album_name,
+                'source': 'ytmusic'
+            }
+        
+        logger.debug('❌ No good YouTube Music results found')
         return None
         
     except Exception as e:
-        print(f"❌ YouTube Music API error: {e}")
+        logger.warning('❌ YouTube Music API error: %s', e)
         return None
 
+# Title cleaning patterns - compiled once instead of on every parsed title
+_BRACKETS_RE = re.compile(r"[\(\[].*?[\)\]]")
+# Shared prefixes are factored out (trie-style) so each word is tried once per position, and the
+# optional suffix is greedy so e.g. "official video" is still removed as a whole
+_JUNK_RE = re.compile(
+    r"(?i)\b(?:official(?: video| audio)?|music video|full song|lyrics|audio|live|remix|cover"
+    r"|slowed|reverb|extended|hd|4k|video|song)\b"
+)
+_WS_RE = re.compile(r"\s+")
+_SPLIT_RE = re.compile(r"[-|]")
+_QUOTE_RE = re.compile(r"^[\"']|[\"']$")
+_FALLBACK_JUNK_RE = re.compile(r"(?i)\s*\b(?:official|lyrics|video|audio|hd|4k|full|song|music)\b")
+
+# Plain "Artist - Song" titles with no brackets, feat. markers or other punctuation
+_CANONICAL_RE = re.compile(r"^[A-Za-z0-9' .]{3,60}\s-\s[A-Za-z0-9' .]{3,60}$")
+
+def _is_already_clean(title):
+    """Check whether a title is already "Artist - Song" shaped, so regex parsing alone is enough"""
+    return bool(_CANONICAL_RE.match(title)) and not _JUNK_RE.search(title)
+
 def clean_title_regex(title: str):
     """Step 3: Regex Cleaning (Fallback Parser)"""
     if not title:
         return None
     
-    print(f"🧹 Regex cleaning: '{title}'")
+    logger.debug("🧹 Regex cleaning: '%s'", title)
     
-    # Remove brackets and common junk words
-    cleaned = re.sub(r"[\(\[].*?[\)\]]", "", title)
-    
-    # Remove common junk words
-    junk_words = [
-        "official video", "lyrics", "audio", "live", "remix", "cover", 
-        "slowed", "reverb", "extended", "full song", "hd", "4k", 
-        "music video", "official audio", "official", "video", "song"
-    ]
+    # Remove brackets
+    cleaned = _BRACKETS_RE.sub("", title)
     
-    for word in junk_words:
-        cleaned = re.sub(word, "", cleaned, flags=re.IGNORECASE)
+    # Remove common junk words (one pass over the string)
+    cleaned = _JUNK_RE.sub("", cleaned)
     
     # Clean up extra spaces
-    cleaned = re.sub(r'\s+', ' ', cleaned).strip()
+    cleaned = _WS_RE.sub(' ', cleaned).strip()
     
     # Split on "-" or "|" to find song name
-    parts = re.split(r"[-|]", cleaned)
+    parts = _SPLIT_RE.split(cleaned)
     if len(parts) > 1:
         # Usually the second part is the song name
         song = parts[1].strip()
@@ -250,35 +494,60 @@ def clean_title_regex(title: str):
         artist = "Unknown Artist"
     
     if song and len(song) > 2:
-        print(f"✅ Regex cleaned: '{song}' by '{artist}'")
+        logger.debug("✅ Regex cleaned: '%s' by '%s'", song, artist)
         return {
             'title': song,
             'artist': artist,
             'source': 'regex'
         }
     
-    print("❌ Regex cleaning failed")
+    logger.debug('❌ Regex cleaning failed')
     return None
 
-def ai_extract_song_simple(title, description=""):
-    """Step 4: AI Extraction (Gemini / Groq) - Return only song name"""
-    if not title:
-        return None
-    
-    print(f"🤖 AI extraction for: '{title}'")
-    
-    # Try Gemini first
-    if GEMINI_API_KEY and not session.get('gemini_quota_exceeded', False):
+# AI extraction results keyed by normalized title - in Redis when available (shared across workers
+# and restarts), otherwise in a bounded in-process LRU dict
+AI_TITLE_CACHE_SIZE = 50000
+AI_TITLE_CACHE_TTL_SECONDS = 30 * 24 * 60 * 60
+ai_title_cache = OrderedDict()
+ai_title_cache_lock = Lock()
+
+def normalize_title(title):
+    """Normalize a video title for lookup caches (lowercase, no brackets, single spaces)"""
+    return _WS_RE.sub(' ', _BRACKETS_RE.sub('', title.lower())).strip()
+
+def get_cached_ai_title(key):
+    """Return a cached AI extraction result for a normalized title, or None"""
+    if redis_client is not None:
         try:
-            check_and_reset_gemini_quota()
-            if not session.get('gemini_quota_exceeded', False):
-                model = genai.GenerativeModel('gemini-1.5-flash')
-                
-                prompt = f"""
-Extract ONLY the song name (not artist, not extra info) from this YouTube video title:
+            cached = redis_client.get(f"ai_title:{key}")
+            return json.loads(cached) if cached else None
+        except Exception as e:
+            logger.warning('Redis AI cache read failed: %s', e)
+    with ai_title_cache_lock:
+        result = ai_title_cache.get(key)
+        if result is not None:
+            ai_title_cache.move_to_end(key)
+    return dict(result) if result else None
 
-Title: {title}
-Description: {description[:200] if description else "No description"}
+def cache_ai_title(key, result):
+    """Store a successful AI extraction result and return it"""
+    if redis_client is not None:
+        try:
+            redis_client.set(f"ai_title:{key}", json.dumps(result), ex=AI_TITLE_CACHE_TTL_SECONDS)
+            return result
+        except Exception as e:
+            logger.warning('Redis AI cache write failed: %s', e)
+    with ai_title_cache_lock:
+        ai_title_cache[key] = dict(result)
+        ai_title_cache.move_to_end(key)
+        if len(ai_title_cache) > AI_TITLE_CACHE_SIZE:
+            ai_title_cache.popitem(last=False)
+    return result
+
+# Instruction and examples shared by every Gemini extraction call - kept as one constant prefix so
+# only the title/description part of the prompt changes between calls
+GEMINI_EXTRACTION_PROMPT = """
+Extract ONLY the song name (not artist, not extra info) from the YouTube video title below.
 
 Return ONLY the song name as plain text. No quotes, no extra words, no artist names.
 Just the song title.
@@ -291,32 +560,60 @@ Input: "Arijit Singh - Tum Hi Ho (Official Video) | Aashiqui 2"
 Output: Tum Hi Ho
 """
 
-                response = model.generate_content(prompt)
-                song_name = response.text.strip()
-                
-                # Clean the response
-                song_name = re.sub(r'^["\']|["\']$', '', song_name)  # Remove quotes
-                song_name = song_name.strip()
+@lru_cache(maxsize=1)
+def get_gemini_model():
+    """Create the Gemini model used for title extraction once and reuse it"""
+    return get_genai().GenerativeModel('gemini-1.5-flash')
+
+def ai_extract_song_simple(title, description=""):
+    """Step 4: AI Extraction (Gemini / Groq) - Return only song name"""
+    if not title:
+        return None
+    
+    logger.debug("🤖 AI extraction for: '%s'", title)
+    
+    # Identical titles (after normalization) are only ever sent to an LLM once
+    cache_key = normalize_title(title)
+    cached = get_cached_ai_title(cache_key)
+    if cached:
+        logger.debug("✅ AI extraction cache hit: '%s'", cached['title'])
+        return cached
+    
+    # Try Gemini first
+    if GEMINI_API_KEY and not is_gemini_quota_exceeded():
+        try:
+            # Fixed instructions first, then only the per-title part
+            prompt = GEMINI_EXTRACTION_PROMPT + f"""
+Title: {title}
+Description: {description[:200] if description else "No description"}
+"""
+
+            response = get_gemini_model().generate_content(prompt)
+            song_name = response.text.strip()
+            
+            # Clean the response
+            song_name = _QUOTE_RE.sub('', song_name)  # Remove quotes
+            song_name = song_name.strip()
+            
+            if song_name and len(song_name) > 2:
+                logger.debug("✅ Gemini extracted: '%s'", song_name)
+                return cache_ai_title(cache_key, {
+                    'title': song_name,
+                    'artist': 'Unknown Artist',
+                    'source': 'gemini'
+                })
                 
-                if song_name and len(song_name) > 2:
-                    print(f"✅ Gemini extracted: '{song_name}'")
-                    return {
-                        'title': song_name,
-                        'artist': 'Unknown Artist',
-                        'source': 'gemini'
-                    }
-                    
         except Exception as e:
             if "quota" in str(e).lower():
-                session['gemini_quota_exceeded'] = True
-                print(f"⚠️ Gemini quota exceeded: {e}")
+                mark_gemini_quota_exceeded()
+                logger.warning('⚠️ Gemini quota exceeded: %s', e)
             else:
-                print(f"❌ Gemini error: {e}")
+                logger.warning('❌ Gemini error: %s', e)
     
     # Try Groq as fallback
     if GROQ_API_KEY:
         try:
-            client = Groq(api_key=GROQ_API_KEY)
+            client = get_groq()
             
             prompt = f"""
 Extract ONLY the song name from this YouTube video title:
@@ -338,30 +635,89 @@ Output: Shape of You
                 max_tokens=100
             )
             
+            logger.debug('Groq usage: %s', getattr(response, 'usage', None))
             song_name = response.choices[0].message.content.strip()
-            song_name = re.sub(r'^["\']|["\']$', '', song_name)
+            song_name = _QUOTE_RE.sub('', song_name)
             song_name = song_name.strip()
             
             if song_name and len(song_name) > 2:
-                print(f"✅ Groq extracted: '{song_name}'")
-                return {
+                logger.debug("✅ Groq extracted: '%s'", song_name)
+                return cache_ai_title(cache_key, {
                     'title': song_name,
                     'artist': 'Unknown Artist',
                     'source': 'groq'
-                }
+                })
                 
         except Exception as e:
-            print(f"❌ Groq error: {e}")
+            logger.warning('❌ Groq error: %s', e)
     
-    print("❌ AI extraction failed")
+    logger.debug('❌ AI extraction failed')
     return None
 
+AI_BATCH_SIZE = 20
+# Multiline so one scan over the response finds every "N: title" line ([^\S\n] = whitespace except newline)
+_NUMBERED_LINE_RE = re.compile(r"(?m)^[^\S\n]*(\d+)[^\S\n]*[:.)][^\S\n]*(.+?)[^\S\n]*$")
+
+def ai_extract_songs_batch(titles):
+    """Extract song names for many titles with one Gemini request per AI_BATCH_SIZE titles
+    
+    Results go into the AI title cache, so ai_extract_song_simple picks them up without another
+    request. Titles the batch could not resolve are left to the single-title path.
+    """
+    if not GEMINI_API_KEY or not titles:
+        return
+    
+    # Only titles that are not cached yet, one per normalized key
+    pending = {}
+    for title in titles:
+        key = normalize_title(title)
+        if key not in pending and get_cached_ai_title(key) is None:
+            pending[key] = title
+    pending = list(pending.items())
+    
+    for start in range(0, len(pending), AI_BATCH_SIZE):
+        if is_gemini_quota_exceeded():
+            return
+        
+        batch = pending[start:start + AI_BATCH_SIZE]
+        numbered_titles = "\n".join(f"{i}: {title}" for i, (_, title) in enumerate(batch, 1))
+        prompt = GEMINI_EXTRACTION_PROMPT + f"""
+Do this for each numbered title below. Return one line per title, prefixed by its number
+(for example "1: Shape of You").
+
+{numbered_titles}
+"""
+        try:
+            response = get_gemini_model().generate_content(prompt)
+        except Exception as e:
+            if "quota" in str(e).lower():
+                mark_gemini_quota_exceeded()
+                logger.warning('⚠️ Gemini quota exceeded: %s', e)
+                return
+            logger.warning('❌ Gemini batch error: %s', e)
+            continue
+        
+        resolved = 0
+        for match in _NUMBERED_LINE_RE.finditer(response.text):
+            if not 1 <= int(match.group(1)) <= len(batch):
+                continue
+            song_name = _QUOTE_RE.sub('', match.group(2)).strip()
+            if len(song_name) > 2:
+                cache_ai_title(batch[int(match.group(1)) - 1][0], {
+                    'title': song_name,
+                    'artist': 'Unknown Artist',
+                    'source': 'gemini'
+                })
+                resolved += 1
+        
+        logger.debug('✅ Gemini batch extracted %s/%s titles', resolved, len(batch))
+
 def fuzzy_match_spotify(song_name, spotify_results, threshold=80):
-    """Step 5: Fuzzy Matching (thefuzz)"""
+    """Step 5: Fuzzy Matching (rapidfuzz)"""
     if not song_name or not spotify_results:
         return None, 0
     
-    print(f"🔍 Fuzzy matching: '{song_name}' against {len(spotify_results)} Spotify results")
+    logger.debug("🔍 Fuzzy matching: '%s' against %s Spotify results", song_name, len(spotify_results))
     
     # Create choices for fuzzy matching
     choices = []
@@ -373,51 +729,58 @@ def fuzzy_match_spotify(song_name, spotify_results, threshold=80):
     if not choices:
         return None, 0
     
-    # Find best match
-    match, score = process.extractOne(song_name, choices, scorer=fuzz.token_sort_ratio)
+    # Find best match - the processor normalizes the query once instead of once per choice
+    match, score, _ = process.extractOne(song_name, choices, scorer=fuzz.token_sort_ratio, processor=default_process)
     
-    print(f"🎯 Best match: '{match}' (score: {score}%)")
+    logger.debug("🎯 Best match: '%s' (score: %s%%)", match, score)
     
     if score >= threshold:
-        print(f"✅ Auto-accept: Score {score}% >= {threshold}%")
+        logger.debug('✅ Auto-accept: Score %s%% >= %s%%', score, threshold)
         return match, score
     else:
-        print(f"⚠️ Needs confirmation: Score {score}% < {threshold}%")
+        logger.debug('⚠️ Needs confirmation: Score %s%% < %s%%', score, threshold)
         return match, score
 
+# Extraction steps in priority order as (label, step) pairs. Each step takes
+# (video_title, video_description, video_metadata). Steps whose backend is not
+# configured are left out once at startup instead of being checked for every song.
+EXTRACTION_STEPS = tuple(
+    (label, step) for label, step, enabled in [
+        # Step 1: Licensed Metadata (if available)
+        ('licensed metadata', lambda title, description, metadata: get_licensed_metadata(metadata), True),
+        # Step 2: YouTube Music API
+        ('YouTube Music API result', lambda title, description, metadata: get_from_ytmusic(title), True),
+        # Step 3: Regex Cleaning
+        ('regex cleaning result', lambda title, description, metadata: clean_title_regex(title), True),
+        # Step 4: AI Extraction
+        ('AI extraction result', lambda title, description, metadata: ai_extract_song_simple(title, description), bool(GEMINI_API_KEY or GROQ_API_KEY)),
+    ]
+    if enabled
+)
+
 def extract_song_new(video_title, video_description="", channel_title="", video_metadata=None):
     """Main orchestrator - Exact Priority Order Implementation"""
-    print(f"\n🎵 NEW EXTRACTION SYSTEM for: '{video_title}'")
-    
-    # Step 1: Licensed Metadata (if available)
-    licensed = get_licensed_metadata(video_metadata)
-    if licensed:
-        print("✅ Using licensed metadata")
-        return licensed
-    
-    # Step 2: YouTube Music API
-    ytmusic_result = get_from_ytmusic(video_title)
-    if ytmusic_result:
-        print("✅ Using YouTube Music API result")
-        return ytmusic_result
-    
-    # Step 3: Regex Cleaning
-    regex_result = clean_title_regex(video_title)
-    if regex_result:
-        print("✅ Using regex cleaning result")
-        return regex_result
-    
-    # Step 4: AI Extraction
-    ai_result = ai_extract_song_simple(video_title, video_description)
-    if ai_result:
-        print("✅ Using AI extraction result")
-        return ai_result
+    logger.debug("🎵 NEW EXTRACTION SYSTEM for: '%s'", video_title)
+    
+    # Fast path: already-clean titles only need licensed metadata / regex, no YTMusic or AI call
+    if video_title and _is_already_clean(video_title):
+        result = get_licensed_metadata(video_metadata) or clean_title_regex(video_title)
+        if result:
+            logger.debug('✅ Using %s (title already clean)', result['source'])
+            return result
+    
+    # Steps 1-4 in priority order (steps without a configured backend were dropped at startup)
+    for step_label, step in EXTRACTION_STEPS:
+        result = step(video_title, video_description, video_metadata)
+        if result:
+            logger.debug('✅ Using %s', step_label)
+            return result
     
     # Step 5: Fallback - return basic cleaned title
-    fallback_title = re.sub(r'[\(\[].*?[\)\]]', '', video_title).strip()
-    fallback_title = re.sub(r'\s*(official|lyrics|video|audio|hd|4k|full|song|music)', '', fallback_title, flags=re.IGNORECASE)
+    fallback_title = _BRACKETS_RE.sub('', video_title).strip()
+    fallback_title = _FALLBACK_JUNK_RE.sub('', fallback_title)
     
-    print("⚠️ Using fallback extraction")
+    logger.debug('⚠️ Using fallback extraction')
     return {
         'title': fallback_title,
         'artist': channel_title or 'Unknown Artist',
@@ -427,10 +790,10 @@ def extract_song_new(video_title, video_description="", channel_title="", video_
 def hybrid_song_parsing(original_title, channel_title=None, video_id=None, access_token=None):
     """NEW EXTRACTION SYSTEM - Exact Priority Order Implementation"""
     
-    print(f"=== NEW EXTRACTION SYSTEM START ===")
-    print(f"Original title: '{original_title}'")
-    print(f"Channel: '{channel_title or 'Unknown'}'")
-    print(f"Video ID: '{video_id or 'None'}'")
+    logger.debug('=== NEW EXTRACTION SYSTEM START ===')
+    logger.debug("Original title: '%s'", original_title)
+    logger.debug("Channel: '%s'", channel_title or 'Unknown')
+    logger.debug("Video ID: '%s'", video_id or 'None')
     
     # Use the new extraction system
     extraction_result = extract_song_new(
@@ -441,7 +804,7 @@ def hybrid_song_parsing(original_title, channel_title=None, video_id=None, acces
     )
     
     if extraction_result:
-        print(f"✅ NEW EXTRACTION SUCCESSFUL: {extraction_result['title']} by {extraction_result['artist']} (source: {extraction_result['source']})")
+        logger.debug('✅ NEW EXTRACTION SUCCESSFUL: %s by %s (source: %s)', extraction_result['title'], extraction_result['artist'], extraction_result['source'])
         return {
             'success': True,
             'method': extraction_result['source'],
@@ -453,7 +816,7 @@ def hybrid_song_parsing(original_title, channel_title=None, video_id=None, acces
         }
     
     # If new extraction system fails, return failure
-    print(f"❌ NEW EXTRACTION SYSTEM FAILED")
+    logger.debug('❌ NEW EXTRACTION SYSTEM FAILED')
     return {
         'success': False,
         'method': 'extraction_failed',
@@ -465,6 +828,46 @@ def hybrid_song_parsing(original_title, channel_title=None, video_id=None, acces
         'fallback_results': []
     }
 
+def build_youtube_song_info(original_title, channel_name, video_id, duration, access_token=None):
+    """Run hybrid parsing on a YouTube title and build the song info used for platform sync"""
+    logger.debug("Processing YouTube title: '%s'", original_title)
+    
+    # Use hybrid parsing approach (NEW EXTRACTION SYSTEM)
+    hybrid_result = hybrid_song_parsing(original_title, channel_name, video_id, access_token)
+    
+    if hybrid_result['success']:
+        # Success - add to platform
+        logger.debug('✅ Hybrid parsing successful: %s by %s (method: %s)', hybrid_result['song_name'], hybrid_result['artist_name'], hybrid_result['method'])
+        
+        return {
+            'title': hybrid_result['song_name'],
+            'artist': hybrid_result['artist_name'],
+            'album': hybrid_result['album_name'],
+            'original_title': original_title,
+            'duration': duration,
+            'gemini_confidence': hybrid_result['confidence'],
+            'channel_name': channel_name,
+            'source': hybrid_result['method'],
+            'spotify_track': hybrid_result.get('spotify_track'),
+            'fallback_results': hybrid_result.get('fallback_results', [])
+        }
+    
+    # Manual selection required
+    logger.debug('⚠️ Manual selection required for: %s by %s', hybrid_result['song_name'], hybrid_result['artist_name'])
+    
+    return {
+        'title': hybrid_result['song_name'],
+        'artist': hybrid_result['artist_name'],
+        'album': hybrid_result['album_name'],
+        'original_title': original_title,
+        'duration': duration,
+        'gemini_confidence': 0.0,
+        'channel_name': channel_name,
+        'source': 'manual_selection',
+        'spotify_track': None,
+        'fallback_results': hybrid_result.get('fallback_results', [])
+    }
+
 def search_spotify_with_cleaned_title(song_name, artist_name, access_token=None):
     """Search Spotify with pre-cleaned title and artist"""
     try:
@@ -475,7 +878,7 @@ def search_spotify_with_cleaned_title(song_name, artist_name, access_token=None)
             return None
             
         # Initialize Spotify client
-        sp = spotipy.Spotify(auth=token)
+        sp = spotify_client(token)
         
         # Try multiple search strategies
         search_queries = [
@@ -487,7 +890,7 @@ def search_spotify_with_cleaned_title(song_name, artist_name, access_token=None)
         
         for query in search_queries:
             print(f"Trying Spotify search: '{query}'")
-            results = sp.search(q=query, type='track', limit=5)
+            results = search_spotify_tracks(sp, query, limit=5)
             
             if results['tracks']['items']:
                 # Return the first result (most relevant)
@@ -502,7 +905,16 @@ def search_spotify_with_cleaned_title(song_name, artist_name, access_token=None)
         print(f"Spotify search error: {e}")
         return None
 
+class OrjsonProvider(JSONProvider):
+    """JSON provider backed by orjson - used by jsonify for every endpoint"""
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=str).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 app.config['SECRET_KEY'] = os.getenv('SECRET_KEY', 'your-secret-key-here')
 
 # Email Configuration (Brevo SMTP)
@@ -519,6 +931,10 @@ app.config['MAIL_DEFAULT_SENDER'] = (os.getenv('MAIL_SENDER_NAME', 'Sync Tunes')
 # Initialize Flask-Mail
 mail = Mail(app)
 # Database Configuration
+# Pool sizing - each gunicorn thread and each title extraction worker can hold a connection
+DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', 10))
+DB_MAX_OVERFLOW = int(os.getenv('DB_MAX_OVERFLOW', 20))
+
 if os.getenv('DATABASE_URL'):
     # Production - PostgreSQL on Railway
     app.config['SQLALCHEMY_DATABASE_URI'] = os.getenv('DATABASE_URL')
@@ -526,8 +942,8 @@ if os.getenv('DATABASE_URL'):
         'pool_timeout': 30,
         'pool_recycle': 300,
         'pool_pre_ping': True,
-        'pool_size': 10,
-        'max_overflow': 20
+        'pool_size': DB_POOL_SIZE,
+        'max_overflow': DB_MAX_OVERFLOW
     }
 else:
     # Development - SQLite
@@ -536,11 +952,26 @@ else:
         'pool_timeout': 30,
         'pool_recycle': -1,
         'pool_pre_ping': True,
+        'pool_size': DB_POOL_SIZE,
+        'max_overflow': DB_MAX_OVERFLOW,
         'connect_args': {
             'timeout': 30,
             'check_same_thread': False
         }
     }
+    
+    # SQLite applies PRAGMAs per connection, so set them on every new pooled connection
+    @event.listens_for(Engine, "connect")
+    def _sqlite_pragmas(dbapi_conn, connection_record):
+        if not isinstance(dbapi_conn, sqlite3.Connection):
+            return
+        cursor = dbapi_conn.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA cache_size=-65536")  # 64 MB
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=268435456")  # 256 MB
+        cursor.close()
 
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 
@@ -565,6 +996,23 @@ else:
     SPOTIFY_REDIRECT_URI = os.getenv('SPOTIFY_REDIRECT_URI', 'http://localhost:5000/spotify_callback')
     YOUTUBE_REDIRECT_URI = os.getenv('YOUTUBE_REDIRECT_URI', 'http://localhost:5000/youtube_callback')
 
+SPOTIFY_SCOPE = 'playlist-read-private playlist-read-collaborative user-read-private playlist-modify-public playlist-modify-private'
+
+def make_spotify_oauth():
+    """Spotify OAuth helper for the connect flow
+    
+    The token is stored on the platform account, so spotipy's token cache lives in memory for this
+    request only (no shared cache file to contaminate).
+    """
+    return SpotifyOAuth(
+        client_id=SPOTIFY_CLIENT_ID,
+        client_secret=SPOTIFY_CLIENT_SECRET,
+        redirect_uri=SPOTIFY_REDIRECT_URI,
+        scope=SPOTIFY_SCOPE,
+        cache_handler=MemoryCacheHandler(),
+        requests_session=http_session
+    )
+
 # YouTube OAuth Configuration
 YOUTUBE_CLIENT_ID = os.getenv('YOUTUBE_CLIENT_ID')
 YOUTUBE_CLIENT_SECRET = os.getenv('YOUTUBE_CLIENT_SECRET')
@@ -575,21 +1023,171 @@ import random
 import string
 
 db = SQLAlchemy(app)
+
+# Server-side sessions - pending tracks and OAuth state live in the database instead of the
+# signed session cookie, so the cookie only carries the session id
+app.config['SESSION_TYPE'] = 'sqlalchemy'
+app.config['SESSION_SQLALCHEMY'] = db
+app.config['SESSION_SQLALCHEMY_TABLE'] = 'sessions'
+app.config['SESSION_USE_SIGNER'] = True
+Session(app)
+
+# Response cache - a finished sync never changes, so sync_details output is cached per viewer.
+# Shared through Redis when REDIS_URL is set so every worker sees the same entries and deletes,
+# otherwise kept in-process
+SYNC_DETAILS_CACHE_TIMEOUT = 3600
+if redis_client is not None:
+    cache = Cache(app, config={'CACHE_TYPE': 'RedisCache', 'CACHE_REDIS_URL': os.getenv('REDIS_URL'),
+                               'CACHE_KEY_PREFIX': 'synctunes:'})
+else:
+    cache = Cache(app, config={'CACHE_TYPE': 'SimpleCache'})
+
+def sync_details_cache_key(sync_id, is_admin, user_id):
+    """Cache key for a sync_details response - admins and users see different logs, and admin/user ids can overlap"""
+    return f"sync_details:{sync_id}:{'admin' if is_admin else 'user'}:{user_id}"
+
 login_manager = LoginManager()
 login_manager.init_app(app)
 login_manager.login_view = 'login'
 
+# Endpoints called via fetch() that expect JSON errors instead of a flash + redirect
+JSON_ENDPOINTS = {'sync_details'}
+
+@app.teardown_request
+def rollback_on_error(exc):
+    """Roll back the DB session if a request ended with an unhandled exception"""
+    if exc is not None:
+        db.session.rollback()
+
+@app.errorhandler(Exception)
+def handle_unexpected_error(e):
+    """Central handler for errors raised by routes - rolls back and reports the error"""
+    if isinstance(e, HTTPException):
+        return e
+    if app.debug:
+        raise e  # Let the debugger show the traceback
+    
+    # The teardown_request hook rolls the session back
+    app.logger.exception("Error in %s", request.endpoint)
+    
+    if request.endpoint in JSON_ENDPOINTS:
+        return jsonify({'success': False, 'error': str(e)}), 500
+    
+    # Only look at a user that is already loaded - the error may have come from the user loader itself
+    user = g.get('_login_user')
+    target = 'dashboard' if user is not None and user.is_authenticated else 'index'
+    # Never bounce back to the page that just failed
+    if request.endpoint == target:
+        return 'An internal error occurred', 500
+    
+    flash(f'An error occurred: {str(e)}')
+    return redirect(url_for(target))
+
 # Custom Jinja2 filters
 @app.template_filter('is_admin')
 def is_admin(user):
     """Check if user is an admin"""
-    return hasattr(user, 'admin_id')
+    return getattr(user, 'is_admin', False)
 
 @app.template_filter('is_user')
 def is_user(user):
     """Check if user is a regular user"""
     return hasattr(user, 'user_id')
 
+def store_playlist_tracks(user_id, platform_id, fetched_playlists):
+    """Store the tracks of freshly fetched playlists with set-based lookups and bulk inserts
+    
+    fetched_playlists is a list of (playlist, tracks) pairs - playlists must already be flushed,
+    and each track is a dict with title, artist, album, duration and platform_specific_id.
+    """
+    # Preload this user's songs and their mappings on this platform (one SELECT each)
+    song_ids_by_key = {
+        (title, artist): song_id
+        for title, artist, song_id in db.session.query(Song.title, Song.artist, Song.song_id).filter(
+            Song.user_id == user_id  # ✅ USER ISOLATION
+        )
+    }
+    mapped_song_ids = {
+        song_id for (song_id,) in db.session.query(PlatformSong.song_id).join(
+            Song, Song.song_id == PlatformSong.song_id
+        ).filter(Song.user_id == user_id, PlatformSong.platform_id == platform_id)
+    }
+    
+    # Collect all missing songs
+    new_songs = {}
+    for playlist, tracks in fetched_playlists:
+        for track in tracks:
+            key = (track['title'], track['artist'])
+            if key not in song_ids_by_key and key not in new_songs:
+                new_songs[key] = {
+                    'user_id': user_id,  # ✅ USER ISOLATION
+                    'title': track['title'],
+                    'artist': track['artist'],
+                    'album': track['album'],
+                    'duration': track['duration']
+                }
+    
+    if new_songs:
+        if db.engine.dialect.insert_executemany_returning:
+            # One multi-row INSERT ... RETURNING; ids are matched back by (title, artist), not by row order
+            inserted = db.session.execute(
+                db.insert(Song).returning(Song.song_id, Song.title, Song.artist),
+                list(new_songs.values())
+            )
+            song_ids_by_key.update({(title, artist): song_id for song_id, title, artist in inserted})
+        else:
+            # Older databases without executemany RETURNING - let the ORM flush fetch the ids
+            songs = {key: Song(**row) for key, row in new_songs.items()}
+            db.session.add_all(songs.values())
+            db.session.flush()
+            song_ids_by_key.update({key: song.song_id for key, song in songs.items()})
+            # Only the ids are needed - keep the identity map from holding the whole library
+            for song in songs.values():
+                db.session.expunge(song)
+    
+    # Build the platform mappings and playlist memberships, skipping duplicates, and write them
+    # with an executemany INSERT every DB_WRITE_CHUNK_SIZE rows
+    today = datetime.now().date()
+    platform_song_rows = []
+    playlist_song_rows = []
+    seen_playlist_songs = set()
+    platform_song_count = 0
+    for playlist, tracks in fetched_playlists:
+        for track in tracks:
+            song_id = song_ids_by_key[(track['title'], track['artist'])]
+            
+            if song_id not in mapped_song_ids:
+                mapped_song_ids.add(song_id)
+                platform_song_rows.append({
+                    'song_id': song_id,
+                    'platform_id': platform_id,
+                    'platform_specific_id': track['platform_specific_id']
+                })
+                if len(platform_song_rows) >= DB_WRITE_CHUNK_SIZE:
+                    db.session.execute(PlatformSong.__table__.insert(), platform_song_rows)
+                    platform_song_count += len(platform_song_rows)
+                    platform_song_rows = []
+            
+            if (playlist.playlist_id, song_id) not in seen_playlist_songs:
+                seen_playlist_songs.add((playlist.playlist_id, song_id))
+                playlist_song_rows.append({
+                    'playlist_id': playlist.playlist_id,
+                    'song_id': song_id,
+                    'added_at': today
+                })
+                if len(playlist_song_rows) >= DB_WRITE_CHUNK_SIZE:
+                    db.session.execute(PlaylistSong.__table__.insert(), playlist_song_rows)
+                    playlist_song_rows = []
+    
+    if platform_song_rows:
+        db.session.execute(PlatformSong.__table__.insert(), platform_song_rows)
+        platform_song_count += len(platform_song_rows)
+    if playlist_song_rows:
+        db.session.execute(PlaylistSong.__table__.insert(), playlist_song_rows)
+    
+    logger.info("Stored %d playlists: %d new songs, %d platform mappings, %d playlist entries",
+                len(fetched_playlists), len(new_songs), platform_song_count, len(seen_playlist_songs))
+
 def fetch_spotify_playlists(user_id, access_token):
     """Fetch user's Spotify playlists and store them"""
     try:
@@ -599,7 +1197,7 @@ def fetch_spotify_playlists(user_id, access_token):
             return False
             
         # Create Spotify client with error handling
-        sp = spotipy.Spotify(auth=access_token)
+        sp = spotify_client(access_token)
         
         # Test the token first with better error handling
         try:
@@ -615,7 +1213,7 @@ def fetch_spotify_playlists(user_id, access_token):
                 flash('Spotify connection failed: Invalid or expired token. Please reconnect.', 'error')
             
             # Mark account as disconnected
-            platform = Platform.query.filter_by(platform_name='Spotify').first()
+            platform = get_platform_by_name('Spotify')
             if platform:
                 account = UserPlatformAccount.query.filter_by(
                     user_id=user_id,
@@ -629,7 +1227,7 @@ def fetch_spotify_playlists(user_id, access_token):
         playlists = sp.current_user_playlists()
         
         # Get user's platform account
-        platform = Platform.query.filter_by(platform_name='Spotify').first()
+        platform = get_platform_by_name('Spotify')
         user_account = UserPlatformAccount.query.filter_by(
             user_id=user_id,
             platform_id=platform.platform_id
@@ -638,77 +1236,52 @@ def fetch_spotify_playlists(user_id, access_token):
         if not user_account:
             return
         
-        # Clear existing playlists for this account
-        existing_playlist_ids = [p.playlist_id for p in Playlist.query.filter_by(account_id=user_account.account_id).all()]
+        # Plain ids from here on - they stay valid even if the ORM objects are expired by a commit
+        platform_id = platform.platform_id
+        account_id = user_account.account_id
         
-        # Clear PlaylistSong relationships first to avoid foreign key issues
-        if existing_playlist_ids:
-            PlaylistSong.query.filter(PlaylistSong.playlist_id.in_(existing_playlist_ids)).delete(synchronize_session=False)
+        # Clear PlaylistSong relationships of the existing playlists first to avoid foreign key issues
+        PlaylistSong.query.filter(PlaylistSong.playlist_id.in_(
+            db.select(Playlist.playlist_id).where(Playlist.account_id == account_id)
+        )).delete(synchronize_session=False)
         
         # Now delete the playlists
-        Playlist.query.filter_by(account_id=user_account.account_id).delete()
+        Playlist.query.filter_by(account_id=account_id).delete(synchronize_session=False)
+        
+        # Fetch every playlist's tracks concurrently (network only), then write to the DB on this thread
+        with ThreadPoolExecutor(max_workers=PLAYLIST_FETCH_MAX_WORKERS) as executor:
+            playlist_tracks = list(executor.map(
+                lambda playlist_data: fetch_spotify_playlist_tracks(sp, playlist_data['id']), playlists['items']
+            ))
         
         # Add new playlists
-        for playlist_data in playlists['items']:
+        today = datetime.now().date()
+        fetched = []
+        for playlist_data, tracks in zip(playlists['items'], playlist_tracks):
             playlist = Playlist(
-                account_id=user_account.account_id,
+                account_id=account_id,
                 name=playlist_data['name'],
                 description=playlist_data.get('description', ''),
-                last_updated=datetime.now().date(),
+                last_updated=today,
                 platform_playlist_id=playlist_data['id']
             )
             db.session.add(playlist)
             
-            # Get playlist tracks
-            tracks = sp.playlist_tracks(playlist_data['id'])
-            for track_data in tracks['items']:
+            track_infos = []
+            for track_data in tracks:
                 track = track_data['track']
                 if track:
-                    # Create or get song (USER-SPECIFIC)
-                    song = Song.query.filter_by(
-                        user_id=user_id,  # ✅ USER ISOLATION
-                        title=track['name'],
-                        artist=track['artists'][0]['name'] if track['artists'] else 'Unknown Artist'
-                    ).first()
-                    
-                    if not song:
-                        song = Song(
-                            user_id=user_id,  # ✅ USER ISOLATION
-                            title=track['name'],
-                            artist=track['artists'][0]['name'] if track['artists'] else 'Unknown Artist',
-                            album=track['album']['name'] if track['album'] else 'Unknown Album',
-                            duration=track['duration_ms'] // 1000
-                        )
-                        db.session.add(song)
-                        db.session.flush()
-                    
-                    # Check if platform song mapping already exists
-                    existing_platform_song = PlatformSong.query.filter_by(
-                        song_id=song.song_id,
-                        platform_id=platform.platform_id
-                    ).first()
-                    
-                    if not existing_platform_song:
-                        platform_song = PlatformSong(
-                            song_id=song.song_id,
-                            platform_id=platform.platform_id,
-                            platform_specific_id=track['id']
-                        )
-                        db.session.add(platform_song)
-                    
-                    # Check if playlist song relationship already exists
-                    existing_playlist_song = PlaylistSong.query.filter_by(
-                        playlist_id=playlist.playlist_id,
-                        song_id=song.song_id
-                    ).first()
-                    
-                    if not existing_playlist_song:
-                        playlist_song = PlaylistSong(
-                            playlist_id=playlist.playlist_id,
-                            song_id=song.song_id,
-                            added_at=datetime.now().date()
-                        )
-                        db.session.add(playlist_song)
+                    track_infos.append({
+                        'title': track['name'],
+                        'artist': track['artists'][0]['name'] if track['artists'] else 'Unknown Artist',
+                        'album': track['album']['name'] if track['album'] else 'Unknown Album',
+                        'duration': track['duration_ms'] // 1000,
+                        'platform_specific_id': track['id']
+                    })
+            fetched.append((playlist, track_infos))
+        
+        db.session.flush()  # Get the playlist ids
+        store_playlist_tracks(user_id, platform_id, fetched)
         
         db.session.commit()
         
@@ -716,6 +1289,54 @@ def fetch_spotify_playlists(user_id, access_token):
         print(f"Error fetching Spotify playlists: {e}")
         db.session.rollback()
 
+# Only the track fields store_playlist_tracks needs - the full track objects are several times larger
+SPOTIFY_PLAYLIST_TRACK_FIELDS = 'items(track(id,name,duration_ms,artists(name),album(name))),next'
+
+def fetch_spotify_playlist_tracks(sp, playlist_id):
+    """Fetch all tracks of a Spotify playlist, following the next links (network only, no DB access)"""
+    page = sp.playlist_items(playlist_id, fields=SPOTIFY_PLAYLIST_TRACK_FIELDS, limit=100, additional_types=('track',))
+    items = page['items']
+    
+    # The next link keeps the fields filter
+    while page.get('next'):
+        page = sp.next(page)
+        items.extend(page['items'])
+    
+    return items
+
+def fetch_youtube_playlist_items(playlist_id, headers):
+    """Fetch all items of a YouTube playlist, following nextPageToken (network only, no DB access)"""
+    items_url = "https://www.googleapis.com/youtube/v3/playlistItems"
+    next_page_token = None
+    items = []
+    
+    while True:
+        items_params = {
+            'part': 'snippet',
+            'playlistId': playlist_id,
+            'maxResults': 50,
+            # Only the fields fetch_youtube_playlists reads
+            'fields': 'items(snippet(title,videoOwnerChannelTitle,resourceId/videoId)),nextPageToken'
+        }
+        
+        if next_page_token:
+            items_params['pageToken'] = next_page_token
+        
+        items_response = http_session.get(items_url, headers=headers, params=items_params)
+        
+        if items_response.status_code != 200:
+            break
+        
+        items_data = items_response.json()
+        items.extend(items_data.get('items', []))
+        
+        # Check if there are more pages
+        next_page_token = items_data.get('nextPageToken')
+        if not next_page_token:
+            break
+    
+    return items
+
 def fetch_youtube_playlists(user_id, access_token):
     """Fetch user's YouTube playlists with pagination"""
     try:
@@ -725,7 +1346,7 @@ def fetch_youtube_playlists(user_id, access_token):
             return False
             
         # Get user's platform account
-        platform = Platform.query.filter_by(platform_name='YouTube').first()
+        platform = get_platform_by_name('YouTube')
         user_account = UserPlatformAccount.query.filter_by(
             user_id=user_id,
             platform_id=platform.platform_id
@@ -734,19 +1355,19 @@ def fetch_youtube_playlists(user_id, access_token):
         if not user_account:
             return False
         
-        # Clear existing playlists for this account with better transaction handling
-        existing_playlist_ids = [p.playlist_id for p in Playlist.query.filter_by(account_id=user_account.account_id).all()]
+        # Plain ids from here on - they stay valid even if the ORM objects are expired by a commit
+        platform_id = platform.platform_id
+        account_id = user_account.account_id
         
-        if existing_playlist_ids:
-            PlaylistSong.query.filter(PlaylistSong.playlist_id.in_(existing_playlist_ids)).delete(synchronize_session=False)
-            db.session.flush()  # Flush the deletes
+        # Clear existing playlists for this account with better transaction handling
+        PlaylistSong.query.filter(PlaylistSong.playlist_id.in_(
+            db.select(Playlist.playlist_id).where(Playlist.account_id == account_id)
+        )).delete(synchronize_session=False)
         
-        Playlist.query.filter_by(account_id=user_account.account_id).delete()
-        db.session.flush()  # Flush the playlist deletes
+        # Bulk deletes run immediately, so no extra flushes are needed
+        Playlist.query.filter_by(account_id=account_id).delete(synchronize_session=False)
         
         # Use the access token to call YouTube Data API v3
-        import requests
-        
         headers = {
             'Authorization': f'Bearer {access_token}',
             'Accept': 'application/json'
@@ -755,12 +1376,13 @@ def fetch_youtube_playlists(user_id, access_token):
         # Get user's playlists
         playlists_url = "https://www.googleapis.com/youtube/v3/playlists"
         params = {
-            'part': 'snippet,contentDetails',
+            'part': 'snippet',
             'mine': 'true',
-            'maxResults': 50
+            'maxResults': 50,
+            'fields': 'items(id,snippet(title,description))'
         }
         
-        response = requests.get(playlists_url, headers=headers, params=params)
+        response = http_session.get(playlists_url, headers=headers, params=params)
         
         if response.status_code == 200:
             data = response.json()
@@ -775,108 +1397,46 @@ def fetch_youtube_playlists(user_id, access_token):
             print(f"YouTube API error: {response.status_code} - {response.text}")
             return False
         
+        # Fetch every playlist's items concurrently (network only), then write to the DB on this thread
+        with ThreadPoolExecutor(max_workers=PLAYLIST_FETCH_MAX_WORKERS) as executor:
+            playlist_items = list(executor.map(
+                lambda playlist_data: fetch_youtube_playlist_items(playlist_data['id'], headers), playlists
+            ))
+        
         # Process playlists
-        for playlist_data in playlists:
-                snippet = playlist_data['snippet']
-                playlist_id = playlist_data['id']
-                playlist = Playlist(
-                    account_id=user_account.account_id,
-                    name=snippet.get('title', 'Unknown Playlist'),
-                    description=snippet.get('description', ''),
-                    last_updated=datetime.now().date(),
-                    platform_playlist_id=playlist_id
-                )
-                db.session.add(playlist)
-                db.session.flush()
+        today = datetime.now().date()
+        fetched = []
+        for playlist_data, items in zip(playlists, playlist_items):
+            snippet = playlist_data['snippet']
+            playlist = Playlist(
+                account_id=account_id,
+                name=snippet.get('title', 'Unknown Playlist'),
+                description=snippet.get('description', ''),
+                last_updated=today,
+                platform_playlist_id=playlist_data['id']
+            )
+            db.session.add(playlist)
+            
+            tracks = []
+            for item in items:
+                snippet = item['snippet']
                 
-                # Get playlist items with pagination
-                items_url = "https://www.googleapis.com/youtube/v3/playlistItems"
-                next_page_token = None
+                # LAZY LOADING: Store original title as-is, process later during sync
+                # This prevents API overload during playlist fetching
+                raw_title = snippet.get('title', 'Unknown Title')
+                channel_title = snippet.get('videoOwnerChannelTitle', 'Unknown Artist')
                 
-                while True:
-                    items_params = {
-                        'part': 'snippet,contentDetails',
-                        'playlistId': playlist_id,
-                        'maxResults': 50
-                    }
-                    
-                    if next_page_token:
-                        items_params['pageToken'] = next_page_token
-                    
-                    items_response = requests.get(items_url, headers=headers, params=items_params)
-                    
-                    if items_response.status_code == 200:
-                        items_data = items_response.json()
-                        items = items_data.get('items', [])
-                        
-                        for item in items:
-                            snippet = item['snippet']
-                            video_id = snippet['resourceId']['videoId']
-                            
-                            # Parse YouTube title using fallback parser for bulk operations
-                            raw_title = snippet.get('title', 'Unknown Title')
-                            channel_title = snippet.get('videoOwnerChannelTitle', 'Unknown Artist')
-                            
-                            # LAZY LOADING: Store original title as-is, process later during sync
-                            # This prevents API overload during playlist fetching
-                            parsed_song_name = raw_title  # Store original title
-                            parsed_artist = channel_title or 'Unknown Artist'
-                            
-                            # Log the parsing for debugging
-                            print(f"YouTube title parsing (bulk): '{raw_title}' -> Song: '{parsed_song_name}', Artist: '{parsed_artist}'")
-                            
-                            # Create or get song (USER-SPECIFIC) - Store original title directly
-                            song = Song.query.filter_by(
-                                user_id=user_id,  # ✅ USER ISOLATION
-                                title=parsed_song_name,  # This is now the original YouTube title
-                                artist=parsed_artist
-                            ).first()
-                            
-                            if not song:
-                                song = Song(
-                                    user_id=user_id,  # ✅ USER ISOLATION
-                                    title=parsed_song_name,  # Original YouTube title
-                                    artist=parsed_artist,
-                                    album="YouTube",  # Mark as YouTube source
-                                    duration=0
-                                )
-                                db.session.add(song)
-                                db.session.flush()
-                            
-                            # Check if platform song mapping already exists
-                            existing_platform_song = PlatformSong.query.filter_by(
-                                song_id=song.song_id,
-                                platform_id=platform.platform_id
-                            ).first()
-                            
-                            if not existing_platform_song:
-                                platform_song = PlatformSong(
-                                    song_id=song.song_id,
-                                    platform_id=platform.platform_id,
-                                    platform_specific_id=video_id
-                                )
-                                db.session.add(platform_song)
-                            
-                            # Check if playlist song relationship already exists
-                            existing_playlist_song = PlaylistSong.query.filter_by(
-                                playlist_id=playlist.playlist_id,
-                                song_id=song.song_id
-                            ).first()
-                            
-                            if not existing_playlist_song:
-                                playlist_song = PlaylistSong(
-                                    playlist_id=playlist.playlist_id,
-                                    song_id=song.song_id,
-                                    added_at=datetime.now().date()
-                                )
-                                db.session.add(playlist_song)
-                        
-                        # Check if there are more pages
-                        next_page_token = items_data.get('nextPageToken')
-                        if not next_page_token:
-                            break
-                    else:
-                        break
+                tracks.append({
+                    'title': raw_title,  # Original YouTube title
+                    'artist': channel_title or 'Unknown Artist',
+                    'album': "YouTube",  # Mark as YouTube source
+                    'duration': 0,
+                    'platform_specific_id': snippet['resourceId']['videoId']
+                })
+            fetched.append((playlist, tracks))
+        
+        db.session.flush()  # Get the playlist ids
+        store_playlist_tracks(user_id, platform_id, fetched)
         
         db.session.commit()
         
@@ -888,7 +1448,7 @@ def fetch_youtube_playlists(user_id, access_token):
 def create_spotify_playlist_api(access_token, name, description):
     """Create a new Spotify playlist"""
     try:
-        sp = spotipy.Spotify(auth=access_token)
+        sp = spotify_client(access_token)
         user_info = sp.current_user()
         user_id = user_info['id']
         
@@ -905,75 +1465,143 @@ def create_spotify_playlist_api(access_token, name, description):
         print(f"Error creating Spotify playlist: {e}")
         return None
 
+def get_pending_tracks():
+    """Get the current user's tracks waiting for confirmation"""
+    return session.get(f'pending_tracks_{current_user.user_id}', [])
+
+def save_pending_tracks(pending_tracks):
+    """Store the current user's pending tracks (assigning the key marks the session as modified)"""
+    session[f'pending_tracks_{current_user.user_id}'] = pending_tracks
+
 def reset_gemini_quota():
     """Reset the Gemini quota flag when a new API key is provided"""
-    session['gemini_quota_exceeded'] = False
-    session['gemini_quota_reset_time'] = None
+    key = gemini_quota_key()
+    with gemini_quota_lock:
+        gemini_quota_expiry.pop(key, None)
+    if redis_client is not None:
+        try:
+            redis_client.delete(key)
+        except Exception as e:
+            print(f"WARNING: Redis quota reset failed: {e}")
     print("🔄 Gemini quota flag reset - ready to use new API key")
 
-def advanced_fuzzy_match(song_title, artist_name, spotify_track):
+# Title similarity (fuzz.ratio, 0-100) below which a Spotify search result is rejected outright
+MIN_TITLE_SIMILARITY = 30
+# Fallback search candidates need at least this title similarity to be offered to the user
+FALLBACK_MIN_TITLE_SIMILARITY = 20
+
+# Album names from major labels that earn a small confidence boost
+_MAJOR_LABELS = frozenset({'t-series', 'sony music', 'zee music'})
+# Channel names containing any of these label names get a confidence boost (one case-insensitive scan)
+_TRUSTED_CHANNEL_RE = re.compile(r"(?i)t-series|sony music|zee music|tips music|venus music")
+
+def _scores_in_order(query, choices, scorer, processor=None, score_cutoff=None):
+    """Score a query against every choice in one rapidfuzz call, returned in the order of choices
+    
+    Choices scoring below score_cutoff get 0 - rapidfuzz stops computing them early.
+    """
+    scores = [0] * len(choices)
+    for _, score, index in process.extract(query, choices, scorer=scorer, processor=processor,
+                                           limit=None, score_cutoff=score_cutoff):
+        scores[index] = score
+    return scores
+
+def advanced_fuzzy_match(song_title, artist_name, spotify_track, title_score_cutoff=None, detailed=True):
     """Advanced fuzzy matching using multiple algorithms"""
-    spotify_title = spotify_track['name'].lower()
-    spotify_artist = spotify_track['artists'][0]['name'].lower()
+    return advanced_fuzzy_match_many(song_title, artist_name, [spotify_track], title_score_cutoff, detailed)[0]
+
+def advanced_fuzzy_match_many(song_title, artist_name, spotify_tracks, title_score_cutoff=None, detailed=True):
+    """Advanced fuzzy matching of one song against several Spotify tracks
+    
+    Each scorer runs once over all candidates, so the query is only prepared once per scorer.
+    Returns one score dict per track, in the order of spotify_tracks. Pass title_score_cutoff
+    when tracks below that title similarity are rejected anyway - their simple ratio is reported as 0.
+    Only the simple ratios feed the composite score; with detailed=False the informational
+    token-set and partial ratios are skipped and left out of the result.
+    """
+    spotify_titles = [spotify_track['name'].lower() for spotify_track in spotify_tracks]
+    spotify_artists = [spotify_track['artists'][0]['name'].lower() for spotify_track in spotify_tracks]
     
     song_title_lower = song_title.lower()
     artist_name_lower = artist_name.lower() if artist_name else ""
+    no_artist_scores = [0] * len(spotify_tracks)
     
-    # 1. Token Set Ratio (ignores word order and duplicates)
-    title_token_ratio = fuzz.token_set_ratio(song_title_lower, spotify_title)
-    artist_token_ratio = fuzz.token_set_ratio(artist_name_lower, spotify_artist) if artist_name else 0
-    
-    # 2. Partial Ratio (handles partial matches)
-    title_partial_ratio = fuzz.partial_ratio(song_title_lower, spotify_title)
-    artist_partial_ratio = fuzz.partial_ratio(artist_name_lower, spotify_artist) if artist_name else 0
+    if detailed:
+        # 1. Token Set Ratio (ignores word order and duplicates)
+        title_token_ratios = _scores_in_order(song_title_lower, spotify_titles, fuzz.token_set_ratio, default_process)
+        artist_token_ratios = _scores_in_order(artist_name_lower, spotify_artists, fuzz.token_set_ratio, default_process) if artist_name else no_artist_scores
+        
+        # 2. Partial Ratio (handles partial matches)
+        title_partial_ratios = _scores_in_order(song_title_lower, spotify_titles, fuzz.partial_ratio)
+        artist_partial_ratios = _scores_in_order(artist_name_lower, spotify_artists, fuzz.partial_ratio) if artist_name else no_artist_scores
     
     # 3. Simple Ratio (exact matching)
-    title_simple_ratio = fuzz.ratio(song_title_lower, spotify_title)
-    artist_simple_ratio = fuzz.ratio(artist_name_lower, spotify_artist) if artist_name else 0
-    
-    # 4. Contains match bonus
-    title_contains = 1 if song_title_lower in spotify_title or spotify_title in song_title_lower else 0
-    artist_contains = 1 if artist_name_lower in spotify_artist or spotify_artist in artist_name_lower else 0
-    
-    # 5. Channel-based confidence boost
-    channel_boost = 0.1 if spotify_track.get('album', {}).get('name', '').lower() in ['t-series', 'sony music', 'zee music'] else 0
-    
-    # CRITICAL FIX: Use simple ratio as PRIMARY metric
-    # Simple ratio is most accurate for exact matches
-    title_score = title_simple_ratio / 100  # Use simple ratio directly
-    artist_score = artist_simple_ratio / 100 if artist_name else 0.5
-    
-    # HEAVY PENALTY for different titles
-    if title_simple_ratio < 60:  # Less than 60% similarity
-        title_score *= 0.5  # Heavy penalty
-    
-    if title_simple_ratio < 40:  # Less than 40% similarity  
-        title_score *= 0.2  # Very heavy penalty
-        
-    if title_simple_ratio < 20:  # Less than 20% similarity
-        title_score *= 0.05  # Extreme penalty
-    
-    # Weighted composite score
-    composite_score = (
-        title_score * 0.6 +  # Title is more important
-        artist_score * 0.3 +  # Artist is important but less so
-        title_contains * 0.05 +  # Contains match bonus
-        artist_contains * 0.05 +  # Contains match bonus
-        channel_boost  # Channel confidence boost
-    )
+    title_simple_ratios = _scores_in_order(song_title_lower, spotify_titles, fuzz.ratio, score_cutoff=title_score_cutoff)
+    artist_simple_ratios = _scores_in_order(artist_name_lower, spotify_artists, fuzz.ratio) if artist_name else no_artist_scores
     
-    return {
-        'composite_score': composite_score,
-        'title_score': title_score,
-        'artist_score': artist_score,
-        'title_simple_ratio': title_simple_ratio,
-        'artist_simple_ratio': artist_simple_ratio,
-        'title_token_ratio': title_token_ratio,
-        'artist_token_ratio': artist_token_ratio,
-        'title_partial_ratio': title_partial_ratio,
-        'artist_partial_ratio': artist_partial_ratio,
-        'contains_match': title_contains or artist_contains
-    }
+    results = []
+    for i, spotify_track in enumerate(spotify_tracks):
+        spotify_title = spotify_titles[i]
+        spotify_artist = spotify_artists[i]
+        title_simple_ratio = title_simple_ratios[i]
+        artist_simple_ratio = artist_simple_ratios[i]
+        
+        # 4. Contains match bonus
+        title_contains = 1 if song_title_lower in spotify_title or spotify_title in song_title_lower else 0
+        artist_contains = 1 if artist_name_lower in spotify_artist or spotify_artist in artist_name_lower else 0
+        
+        # 5. Channel-based confidence boost
+        channel_boost = 0.1 if spotify_track.get('album', {}).get('name', '').lower() in _MAJOR_LABELS else 0
+        
+        # CRITICAL FIX: Use simple ratio as PRIMARY metric
+        # Simple ratio is most accurate for exact matches
+        title_score = title_simple_ratio / 100  # Use simple ratio directly
+        artist_score = artist_simple_ratio / 100 if artist_name else 0.5
+        
+        # HEAVY PENALTY for different titles
+        if title_simple_ratio < 60:  # Less than 60% similarity
+            title_score *= 0.5  # Heavy penalty
+        
+        if title_simple_ratio < 40:  # Less than 40% similarity  
+            title_score *= 0.2  # Very heavy penalty
+            
+        if title_simple_ratio < 20:  # Less than 20% similarity
+            title_score *= 0.05  # Extreme penalty
+        
+        # Weighted composite score
+        composite_score = (
+            title_score * 0.6 +  # Title is more important
+            artist_score * 0.3 +  # Artist is important but less so
+            title_contains * 0.05 +  # Contains match bonus
+            artist_contains * 0.05 +  # Contains match bonus
+            channel_boost  # Channel confidence boost
+        )
+        
+        scores = {
+            'composite_score': composite_score,
+            'title_score': title_score,
+            'artist_score': artist_score,
+            'title_simple_ratio': title_simple_ratio,
+            'artist_simple_ratio': artist_simple_ratio,
+            'contains_match': title_contains or artist_contains
+        }
+        if detailed:
+            scores.update({
+                'title_token_ratio': title_token_ratios[i],
+                'artist_token_ratio': artist_token_ratios[i],
+                'title_partial_ratio': title_partial_ratios[i],
+                'artist_partial_ratio': artist_partial_ratios[i]
+            })
+        results.append(scores)
+    
+    return results
+
+# Confidence multiplier per Spotify search strategy
+SEARCH_STRATEGY_MULTIPLIERS = {
+    'artist': 1.2,    # Artist search is most reliable
+    'album': 1.1,     # Album search is good
+    'song_only': 0.9  # Song-only search is less reliable
+}
 
 def calculate_confidence_score(gemini_confidence, fuzzy_scores, search_strategy, channel_name=None):
     """Calculate overall confidence score based on multiple factors"""
@@ -985,16 +1613,10 @@ def calculate_confidence_score(gemini_confidence, fuzzy_scores, search_strategy,
     fuzzy_confidence = fuzzy_scores.get('composite_score', 0.0)
     
     # Search strategy multiplier
-    strategy_multipliers = {
-        'artist': 1.2,    # Artist search is most reliable
-        'album': 1.1,     # Album search is good
-        'song_only': 0.9  # Song-only search is less reliable
-    }
-    strategy_multiplier = strategy_multipliers.get(search_strategy, 1.0)
+    strategy_multiplier = SEARCH_STRATEGY_MULTIPLIERS.get(search_strategy, 1.0)
     
     # Channel confidence boost
-    trusted_channels = ['t-series', 'sony music', 'zee music', 'tips music', 'venus music']
-    channel_boost = 0.1 if channel_name and any(channel in channel_name.lower() for channel in trusted_channels) else 0
+    channel_boost = 0.1 if channel_name and _TRUSTED_CHANNEL_RE.search(channel_name) else 0
     
     # Calculate weighted confidence
     overall_confidence = (
@@ -1008,8 +1630,6 @@ def calculate_confidence_score(gemini_confidence, fuzzy_scores, search_strategy,
 def create_youtube_playlist_api(access_token, title, description):
     """Create a new YouTube playlist"""
     try:
-        import requests
-        
         headers = {
             'Authorization': f'Bearer {access_token}',
             'Content-Type': 'application/json'
@@ -1026,10 +1646,11 @@ def create_youtube_playlist_api(access_token, title, description):
             }
         }
         
-        response = requests.post(
-            'https://www.googleapis.com/youtube/v3/playlists?part=snippet,status',
+        response = http_session.post(
+            'https://www.googleapis.com/youtube/v3/playlists',
+            params={'part': 'snippet,status'},
             headers=headers,
-            data=json.dumps(data)
+            json=data
         )
         
         if response.status_code == 200:
@@ -1042,51 +1663,76 @@ def create_youtube_playlist_api(access_token, title, description):
         print(f"Error creating YouTube playlist: {e}")
         return None
 
+def add_tracks_to_spotify_playlist(sp, spotify_playlist_id, track_uris):
+    """Add tracks to a Spotify playlist in batches (Spotify accepts up to 100 URIs per call)
+    
+    A batch the API rejects is retried one track at a time, so one bad URI only loses itself.
+    Returns the set of URIs that could not be added.
+    """
+    failed_uris = set()
+    
+    for start in range(0, len(track_uris), SPOTIFY_ADD_ITEMS_BATCH_SIZE):
+        batch = track_uris[start:start + SPOTIFY_ADD_ITEMS_BATCH_SIZE]
+        try:
+            sp.playlist_add_items(spotify_playlist_id, batch)
+            print(f"✅ Added batch of {len(batch)} tracks to Spotify playlist {spotify_playlist_id}")
+            continue
+        except Exception as e:
+            print(f"❌ Error adding batch of {len(batch)} tracks to Spotify playlist {spotify_playlist_id}, retrying one by one: {e}")
+        
+        for track_uri in batch:
+            try:
+                sp.playlist_add_items(spotify_playlist_id, [track_uri])
+            except Exception as e:
+                print(f"❌ Error adding track {track_uri} to Spotify playlist {spotify_playlist_id}: {e}")
+                failed_uris.add(track_uri)
+    
+    return failed_uris
+
 def update_spotify_playlist(access_token, playlist, songs_to_add):
     """Update a Spotify playlist with new songs"""
-    print(f"=== update_spotify_playlist CALLED ===")
-    print(f"Playlist: {playlist.name}")
-    print(f"Songs to add: {len(songs_to_add)}")
-    
-    # Log to file for better debugging
-    with open('/tmp/sync_debug.log', 'a') as f:
-        f.write(f"=== update_spotify_playlist CALLED ===\n")
-        f.write(f"Playlist: {playlist.name}\n")
-        f.write(f"Songs to add: {len(songs_to_add)}\n")
+    # Log to file
+    sync_debug_log.debug("=== update_spotify_playlist CALLED ===")
+    sync_debug_log.debug("Playlist: %s", playlist.name)
+    sync_debug_log.debug("Songs to add: %s", len(songs_to_add))
     
     try:
-        sp = spotipy.Spotify(auth=access_token)
+        sp = spotify_client(access_token)
         songs_added = 0
+        # Pre-found and auto-matched tracks, added in batches after the loop, as (track URI, pending
+        # entry used if the add fails, UserFeedback row written once the add succeeds or None)
+        queued_tracks = []
+        user_id = current_user.user_id  # Resolved once - current_user is a proxy looked up on every access
+        # Tracks needing user confirmation - loaded once and saved back to the session once after the loop
+        pending_tracks = get_pending_tracks()
+        pending_count = len(pending_tracks)
         
         for song_info in songs_to_add:
             try:
-                print(f"Processing song: '{song_info['title']}' by '{song_info['artist']}' (source: {song_info.get('source', 'unknown')})")
+                # Fields read throughout this iteration
+                title = song_info['title']
+                artist = song_info.get('artist')
+                album = song_info.get('album')
+                youtube_title = song_info.get('original_title')  # Set for songs coming from YouTube
+                original_title = song_info.get('original_title', title)
+                source_channel = song_info.get('channel_name')
+                gemini_confidence = song_info.get('gemini_confidence', 0.5)
+                
+                logger.debug("Processing song: '%s' by '%s' (source: %s)", title, artist, song_info.get('source', 'unknown'))
                 
                 # Check if we already have a Spotify track from hybrid parsing
                 if song_info.get('spotify_track'):
-                    print(f"✅ Using pre-found Spotify track: {song_info['spotify_track']['name']}")
-                    print(f"🔍 Debug - Playlist ID: {playlist.platform_playlist_id}")
-                    print(f"🔍 Debug - Track URI: {song_info['spotify_track']['uri']}")
-                    try:
-                        result = sp.playlist_add_items(playlist.platform_playlist_id, [song_info['spotify_track']['uri']])
-                        songs_added += 1
-                        print(f"✅ Auto-added good match: '{song_info['title']}' -> '{song_info['spotify_track']['name']}'")
-                        print(f"🔍 Debug - Spotify API result: {result}")
-                        
-                        # Verify the song was actually added by checking playlist
-                        try:
-                            playlist_tracks = sp.playlist_tracks(playlist.platform_playlist_id, limit=1, offset=0)
-                            print(f"🔍 Debug - Playlist now has {playlist_tracks['total']} tracks")
-                        except Exception as verify_error:
-                            print(f"🔍 Debug - Could not verify playlist: {verify_error}")
-                        
-                        continue
-                    except Exception as e:
-                        print(f"❌ Error adding pre-found track: {e}")
-                        print(f"🔍 Debug - Playlist ID: {playlist.platform_playlist_id}")
-                        print(f"🔍 Debug - Track URI: {song_info['spotify_track']['uri']}")
-                        print(f"🔍 Debug - Error type: {type(e).__name__}")
-                        # Continue to regular search
+                    logger.debug('✅ Using pre-found Spotify track: %s', song_info['spotify_track']['name'])
+                    logger.debug('🔍 Debug - Track URI: %s', song_info['spotify_track']['uri'])
+                    # Queued and added in batches of SPOTIFY_ADD_ITEMS_BATCH_SIZE after the loop
+                    queued_tracks.append((song_info['spotify_track']['uri'], {
+                        'song_info': song_info,
+                        'spotify_track': song_info['spotify_track'],
+                        'confidence': gemini_confidence,
+                        'search_strategy': 'add_failed',
+                        'fuzzy_scores': {}
+                    }, None))
+                    continue
                 
                 # Note: Manual selection songs are now handled in sync_playlist_songs function
                 # This function only receives songs that are ready to be added to Spotify
@@ -1095,28 +1741,28 @@ def update_spotify_playlist(access_token, playlist, songs_to_add):
                 search_strategies = []
                 
                 # Strategy 1: Search with artist name
-                if song_info.get('artist'):
+                if artist:
                     search_strategies.append({
                         'name': 'artist',
                         'queries': [
-                            f'track:"{song_info["title"]}" artist:"{song_info["artist"]}"',
-                            f'track:{song_info["title"]} artist:{song_info["artist"]}',
-                            f'"{song_info["title"]}" "{song_info["artist"]}"',
-                            f'{song_info["title"]} {song_info["artist"]}'
+                            f'track:"{title}" artist:"{artist}"',
+                            f'track:{title} artist:{artist}',
+                            f'"{title}" "{artist}"',
+                            f'{title} {artist}'
                         ]
                     })
                 
                 # Strategy 2: Search with album name
-                if song_info.get('album'):
+                if album:
                     search_strategies.append({
                         'name': 'album',
                         'queries': [
-                            f'track:"{song_info["title"]}" album:"{song_info["album"]}"',
-                            f'track:{song_info["title"]} album:{song_info["album"]}',
-                            f'"{song_info["title"]}" "{song_info["album"]}"',
-                            f'{song_info["title"]} {song_info["album"]}',
-                            f'"{song_info["album"]}" "{song_info["title"]}"',  # Album first
-                            f'{song_info["album"]} {song_info["title"]}'  # Album first
+                            f'track:"{title}" album:"{album}"',
+                            f'track:{title} album:{album}',
+                            f'"{title}" "{album}"',
+                            f'{title} {album}',
+                            f'"{album}" "{title}"',  # Album first
+                            f'{album} {title}'  # Album first
                         ]
                     })
                 
@@ -1124,18 +1770,18 @@ def update_spotify_playlist(access_token, playlist, songs_to_add):
                 search_strategies.append({
                     'name': 'song_only',
                     'queries': [
-                        f'track:"{song_info["title"]}"',
-                        f'track:{song_info["title"]}',
-                        f'"{song_info["title"]}"',
-                        f'{song_info["title"]} song',
-                        f'{song_info["title"]} music',
-                        f'{song_info["title"]} audio',
+                        f'track:"{title}"',
+                        f'track:{title}',
+                        f'"{title}"',
+                        f'{title} song',
+                        f'{title} music',
+                        f'{title} audio',
                         # Add more specific queries for better results
-                        f'{song_info["title"]} bollywood',
-                        f'{song_info["title"]} hindi',
-                        f'{song_info["title"]} telugu',
-                        f'{song_info["title"]} tamil',
-                        f'{song_info["title"]} punjabi'
+                        f'{title} bollywood',
+                        f'{title} hindi',
+                        f'{title} telugu',
+                        f'{title} tamil',
+                        f'{title} punjabi'
                     ]
                 })
                 
@@ -1145,10 +1791,10 @@ def update_spotify_playlist(access_token, playlist, songs_to_add):
                 used_query = None
                 
                 for strategy in search_strategies:
-                    print(f"Trying {strategy['name']} strategy...")
+                    logger.debug('Trying %s strategy...', strategy['name'])
                     for query in strategy['queries']:
-                        print(f"  Query: {query}")
-                        results = sp.search(q=query, type='track', limit=1)
+                        logger.debug('  Query: %s', query)
+                        results = search_spotify_tracks(sp, query)
                         if results['tracks']['items']:
                             used_strategy = strategy['name']
                             used_query = query
@@ -1156,27 +1802,30 @@ def update_spotify_playlist(access_token, playlist, songs_to_add):
                     if results and results['tracks']['items']:
                         break
                 
-                print(f"Search results: {len(results['tracks']['items'])} tracks found using {used_strategy} strategy: {used_query}")
+                logger.debug('Search results: %s tracks found using %s strategy: %s', len(results['tracks']['items']), used_strategy, used_query)
                 
                 if results['tracks']['items']:
                     track = results['tracks']['items'][0]
                     track_uri = track['uri']
-                    print(f"Found track: {track['name']} by {track['artists'][0]['name']} - URI: {track_uri}")
+                    logger.debug('Found track: %s by %s - URI: %s', track['name'], track['artists'][0]['name'], track_uri)
                     
                     # Advanced fuzzy matching
                     fuzzy_scores = advanced_fuzzy_match(
-                        song_info['title'], 
-                        song_info.get('artist'), 
-                        track
+                        title, 
+                        artist, 
+                        track,
+                        title_score_cutoff=MIN_TITLE_SIMILARITY,
+                        detailed=False
                     )
                     
-                    # Debug logging
-                    print(f"🔍 Fuzzy matching debug:")
-                    print(f"  Original: '{song_info['title']}' by '{song_info.get('artist', 'Unknown')}'")
-                    print(f"  Spotify:  '{track['name']}' by '{track['artists'][0]['name']}'")
-                    print(f"  Title similarity: {fuzzy_scores.get('title_simple_ratio', 0)}%")
-                    print(f"  Artist similarity: {fuzzy_scores.get('artist_simple_ratio', 0)}%")
-                    print(f"  Composite score: {fuzzy_scores.get('composite_score', 0):.3f}")
+                    # Debug logging (per-song tracing is skipped entirely unless LOG_LEVEL=DEBUG)
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug('🔍 Fuzzy matching debug:')
+                        logger.debug("  Original: '%s' by '%s'", title, artist or 'Unknown')
+                        logger.debug("  Spotify:  '%s' by '%s'", track['name'], track['artists'][0]['name'])
+                        logger.debug('  Title similarity: %s%%', fuzzy_scores.get('title_simple_ratio', 0))
+                        logger.debug('  Artist similarity: %s%%', fuzzy_scores.get('artist_simple_ratio', 0))
+                        logger.debug('  Composite score: %.3f', fuzzy_scores.get('composite_score', 0))
                     
                     # Additional validation for problematic matches
                     spotify_title = track['name'].strip()
@@ -1184,20 +1833,20 @@ def update_spotify_playlist(access_token, playlist, songs_to_add):
                     
                     # Reject matches with empty or very short titles
                     if not spotify_title or len(spotify_title) < 2:
-                        print(f"❌ Rejecting match: Empty or too short Spotify title")
+                        logger.debug('❌ Rejecting match: Empty or too short Spotify title')
                         continue
                     
                     # Reject matches where titles are completely different
-                    if fuzzy_scores.get('title_simple_ratio', 0) < 30:
-                        print(f"❌ Rejecting match: Title similarity too low ({fuzzy_scores.get('title_simple_ratio', 0)}%)")
+                    if fuzzy_scores.get('title_simple_ratio', 0) < MIN_TITLE_SIMILARITY:
+                        logger.debug('❌ Rejecting match: Title similarity too low (%s%%)', fuzzy_scores.get('title_simple_ratio', 0))
                         continue
                     
                     # Calculate overall confidence score
                     overall_confidence = calculate_confidence_score(
-                        song_info.get('gemini_confidence', 0.5),
+                        gemini_confidence,
                         fuzzy_scores,
                         used_strategy,
-                        song_info.get('channel_name')
+                        source_channel
                     )
                     
                     # Confidence-based triage (STRICTER THRESHOLDS)
@@ -1214,63 +1863,63 @@ def update_spotify_playlist(access_token, playlist, songs_to_add):
                         match_quality = "VERY_LOW"
                         is_good_match = False  # Needs user confirmation
                     
-                    print(f"Advanced validation ({used_strategy}): '{song_info['title']}' vs '{track['name']}'")
-                    print(f"Fuzzy scores: {fuzzy_scores}")
-                    print(f"Title similarity: {fuzzy_scores.get('title_simple_ratio', 0)}% simple, {fuzzy_scores.get('title_token_ratio', 0)}% token")
-                    print(f"Overall confidence: {overall_confidence:.3f} ({match_quality})")
-                    print(f"Good match: {is_good_match}")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Advanced validation (%s): '%s' vs '%s'", used_strategy, title, track['name'])
+                        logger.debug('Fuzzy scores: %s', fuzzy_scores)
+                        logger.debug('Title similarity: %s%% simple', fuzzy_scores.get('title_simple_ratio', 0))
+                        logger.debug('Overall confidence: %.3f (%s)', overall_confidence, match_quality)
+                        logger.debug('Good match: %s', is_good_match)
                     
                     if is_good_match:
-                        # Auto-add good matches
-                        spotify_playlist_id = playlist.platform_playlist_id
-                        if spotify_playlist_id:
-                            print(f"Auto-adding good match: {track['name']}")
-                    sp.playlist_add_items(spotify_playlist_id, [track_uri])
-                    songs_added += 1
-                    print(f"Successfully added '{song_info['title']}' to Spotify playlist")
-                    
-                    # Log success to file
-                    with open('/tmp/sync_debug.log', 'a') as f:
-                        f.write(f"Auto-added good match: '{song_info['title']}' -> '{track['name']}'\n")
-                    
-                    # Store user feedback for learning
-                    if song_info.get('original_title'):
-                        feedback = UserFeedback(
-                            user_id=current_user.user_id,
-                            original_youtube_title=song_info['original_title'],
-                            original_channel=song_info.get('channel_name'),
-                            corrected_song_name=track['name'],
-                            corrected_artist=track['artists'][0]['name'],
-                            corrected_album=track['album']['name'],
-                            spotify_uri=track['uri'],
-                            confidence_score=overall_confidence,
-                            feedback_type='confirmation'
-                        )
-                        db.session.add(feedback)
-                        db.session.commit()
+                        # Auto-add good matches - queued with the pre-found tracks and added in batches after the loop
+                        logger.debug('Auto-adding good match: %s', track['name'])
+                        
+                        # Log success to file
+                        sync_debug_log.debug("Auto-added good match: '%s' -> '%s'", title, track['name'])
+                        
+                        # Store user feedback for learning (inserted in one statement after the loop,
+                        # only if the track was actually added)
+                        feedback_row = {
+                            'user_id': user_id,
+                            'original_youtube_title': youtube_title,
+                            'original_channel': source_channel,
+                            'corrected_song_name': track['name'],
+                            'corrected_artist': track['artists'][0]['name'],
+                            'corrected_album': track['album']['name'],
+                            'spotify_uri': track['uri'],
+                            'confidence_score': overall_confidence,
+                            'feedback_type': 'confirmation'
+                        } if youtube_title else None
+                        queued_tracks.append((track_uri, {
+                            'song_info': song_info,
+                            'spotify_track': track,
+                            'confidence': overall_confidence,
+                            'search_strategy': 'add_failed',
+                            'fuzzy_scores': {
+                                'title_simple_ratio': fuzzy_scores['title_simple_ratio'],
+                                'artist_simple_ratio': fuzzy_scores['artist_simple_ratio']
+                            }
+                        }, feedback_row))
                         continue
-                else:
-                    print(f"Found track but poor match: '{track['name']}' vs '{song_info['title']}' - trying fallback search")
+                    
+                    logger.debug("Found track but poor match: '%s' vs '%s' - trying fallback search", track['name'], title)
                     # Store poor match for user confirmation
-                    if song_info.get('original_title'):
-                        # Store in session for user confirmation
-                        if 'pending_tracks' not in session:
-                            session[f'pending_tracks_{current_user.user_id}'] = []
-                        
+                    if youtube_title:
                         # Calculate title similarity for user comparison
-                        original_title = song_info.get('original_title', song_info['title'])
                         spotify_title = track['name']
                         title_similarity = fuzz.ratio(original_title.lower(), spotify_title.lower())
                         
-                        session[f'pending_tracks_{current_user.user_id}'].append({
+                        pending_tracks.append({
                                 'song_info': song_info,
                                 'spotify_track': track,
                                 'confidence': overall_confidence,
                                 'search_strategy': 'poor_match',
+                                # Same inputs as advanced_fuzzy_match above, so reuse its scores; the
+                                # token-set ratio is only needed here, so it is computed only for poor matches
                                 'fuzzy_scores': {
-                                    'title_simple_ratio': fuzz.ratio(song_info['title'].lower(), track['name'].lower()),
-                                    'title_token_ratio': fuzz.token_set_ratio(song_info['title'].lower(), track['name'].lower()),
-                                    'artist_simple_ratio': fuzz.ratio(song_info.get('artist', '').lower(), track['artists'][0]['name'].lower()) if song_info.get('artist') else 0
+                                    'title_simple_ratio': fuzzy_scores['title_simple_ratio'],
+                                    'title_token_ratio': fuzz.token_set_ratio(title.lower(), track['name'].lower(), processor=default_process),
+                                    'artist_simple_ratio': fuzzy_scores['artist_simple_ratio']
                                 },
                                 'title_comparison': {
                                     'original_youtube_title': original_title,
@@ -1279,156 +1928,184 @@ def update_spotify_playlist(access_token, playlist, songs_to_add):
                                     'is_similar': title_similarity >= 50
                                 }
                             })
-                        session.modified = True
-                        print(f"Stored poor match for user confirmation: {track['name']}")
-                        # Continue to fallback search
+                        logger.debug('Stored poor match for user confirmation: %s', track['name'])
+                else:
+                    logger.debug("No Spotify results for '%s' - trying fallback search", title)
+                
+                # Poor match or no results: re-analyze the full YouTube title and search again
+                logger.debug('All strategies failed, re-analyzing the full YouTube title...')
+                # Fallback results are appended to the same pending_tracks list
+                channel_name = source_channel or 'Unknown'
+                
+                # Use new extraction system to re-analyze the full YouTube title
+                extraction_result = extract_song_new(
+                    video_title=original_title,
+                    video_description="",
+                    channel_title=channel_name,
+                    video_metadata=None
+                )
+                
+                if extraction_result:
+                    corrected_song_name = extraction_result['title']
+                    logger.debug("New extraction system re-analysis: '%s' -> '%s'", original_title, corrected_song_name)
+                else:
+                    # Fallback to basic cleaning
+                    corrected_song_name = _BRACKETS_RE.sub('', original_title).strip()
+                    corrected_song_name = _FALLBACK_JUNK_RE.sub('', corrected_song_name)
+                    logger.debug("Fallback cleaning: '%s' -> '%s'", original_title, corrected_song_name)
                     
-                        # Try fallback search with Gemini re-analysis of full YouTube title
-                        print(f"All strategies failed, asking Gemini to re-analyze full YouTube title...")
-                        
-                        # Initialize pending_tracks for fallback results
-                        if f'pending_tracks_{current_user.user_id}' not in session:
-                            session[f'pending_tracks_{current_user.user_id}'] = []
-                        pending_tracks = session[f'pending_tracks_{current_user.user_id}']
-                        
-                        # Get the original YouTube title for re-analysis
-                        original_title = song_info.get('original_title', song_info['title'])
-                        channel_name = song_info.get('channel_name', 'Unknown')
-                        
-                    # Use new extraction system to re-analyze the full YouTube title
-                    extraction_result = extract_song_new(
-                        video_title=original_title,
-                        video_description="",
-                        channel_title=channel_name,
-                        video_metadata=None
+                # Now search Spotify with the corrected song name using more targeted queries
+                fallback_queries = [
+                    f'track:"{corrected_song_name}"',  # Exact phrase match
+                    f'"{corrected_song_name}"',        # Phrase search
+                    f'track:{corrected_song_name}',    # Standard search
+                    f'{corrected_song_name}',          # Simple search
+                ]
+                
+                # Add artist-specific searches if we have artist info
+                if artist and artist != 'Unknown':
+                    artist_name = artist
+                    fallback_queries.extend([
+                        f'track:"{corrected_song_name}" artist:"{artist_name}"',
+                        f'"{corrected_song_name}" "{artist_name}"',
+                        f'{corrected_song_name} {artist_name}',
+                    ])
+                
+                # Add album-specific searches if we have album info
+                if album and album != 'Unknown':
+                    album_name = album
+                    fallback_queries.extend([
+                        f'track:"{corrected_song_name}" album:"{album_name}"',
+                        f'"{corrected_song_name}" "{album_name}"',
+                    ])
+                
+                fallback_results = None
+                used_fallback_query = None
+                
+                for query in fallback_queries:
+                    logger.debug('Trying fallback query: %s', query)
+                    fallback_results = search_spotify_tracks(sp, query, limit=10)  # Get more results
+                    if fallback_results['tracks']['items']:
+                        used_fallback_query = query
+                        # Don't break immediately - try to get more diverse results
+                        if len(fallback_results['tracks']['items']) >= 5:
+                            break
+                
+                logger.debug('Fallback search results: %s tracks found using query: %s', len(fallback_results['tracks']['items']), used_fallback_query)
+                
+                if fallback_results['tracks']['items']:
+                    logger.debug('Fallback search found %s tracks', len(fallback_results['tracks']['items']))
+                    
+                    # Find the best fallback matches using advanced fuzzy matching
+                    fallback_tracks = []
+                    
+                    # Use the same advanced fuzzy matching as main search, scoring all candidates at once
+                    candidate_tracks = fallback_results['tracks']['items']
+                    candidate_scores = advanced_fuzzy_match_many(
+                        corrected_song_name, artist or '', candidate_tracks,
+                        title_score_cutoff=FALLBACK_MIN_TITLE_SIMILARITY,
+                        detailed=False
                     )
                     
-                    if extraction_result:
-                        corrected_song_name = extraction_result['title']
-                        print(f"New extraction system re-analysis: '{original_title}' -> '{corrected_song_name}'")
-                    else:
-                        # Fallback to basic cleaning
-                        corrected_song_name = re.sub(r'[\(\[].*?[\)\]]', '', original_title).strip()
-                        corrected_song_name = re.sub(r'\s*(official|lyrics|video|audio|hd|4k|full|song|music)', '', corrected_song_name, flags=re.IGNORECASE)
-                        print(f"Fallback cleaning: '{original_title}' -> '{corrected_song_name}'")
+                    for track, fuzzy_scores in zip(candidate_tracks, candidate_scores):
+                        # Only include tracks with reasonable similarity - the others are dropped
+                        # before any confidence work is done for them
+                        if fuzzy_scores.get('title_simple_ratio', 0) < FALLBACK_MIN_TITLE_SIMILARITY:
+                            continue
                         
-                        # Now search Spotify with the corrected song name using more targeted queries
-                        fallback_queries = [
-                            f'track:"{corrected_song_name}"',  # Exact phrase match
-                            f'"{corrected_song_name}"',        # Phrase search
-                            f'track:{corrected_song_name}',    # Standard search
-                            f'{corrected_song_name}',          # Simple search
-                        ]
-                        
-                        # Add artist-specific searches if we have artist info
-                        if song_info.get('artist') and song_info['artist'] != 'Unknown':
-                            artist_name = song_info['artist']
-                            fallback_queries.extend([
-                                f'track:"{corrected_song_name}" artist:"{artist_name}"',
-                                f'"{corrected_song_name}" "{artist_name}"',
-                                f'{corrected_song_name} {artist_name}',
-                            ])
-                        
-                        # Add album-specific searches if we have album info
-                        if song_info.get('album') and song_info['album'] != 'Unknown':
-                            album_name = song_info['album']
-                            fallback_queries.extend([
-                                f'track:"{corrected_song_name}" album:"{album_name}"',
-                                f'"{corrected_song_name}" "{album_name}"',
-                            ])
-                        
-                        fallback_results = None
-                        used_fallback_query = None
-                        
-                        for query in fallback_queries:
-                            print(f"Trying fallback query: {query}")
-                            fallback_results = sp.search(q=query, type='track', limit=10)  # Get more results
-                            if fallback_results['tracks']['items']:
-                                used_fallback_query = query
-                                # Don't break immediately - try to get more diverse results
-                                if len(fallback_results['tracks']['items']) >= 5:
-                                    break
+                        # Calculate confidence using the same method as main search
+                        fallback_confidence = calculate_confidence_score(
+                            gemini_confidence,
+                            fuzzy_scores,
+                            'song_only',  # Fallback is always song-only search
+                            source_channel
+                        )
                         
-                        print(f"Fallback search results: {len(fallback_results['tracks']['items'])} tracks found using query: {used_fallback_query}")
+                        logger.debug("Fallback validation: '%s' vs '%s'", corrected_song_name, track['name'])
+                        logger.debug('Fuzzy scores: %s', fuzzy_scores)
+                        logger.debug('Fallback confidence: %.3f', fallback_confidence)
                         
-                        if fallback_results['tracks']['items']:
-                            print(f"Fallback search found {len(fallback_results['tracks']['items'])} tracks")
-                            
-                            # Find the best fallback matches using advanced fuzzy matching
-                            fallback_tracks = []
-                            
-                            for track in fallback_results['tracks']['items']:
-                                # Use the same advanced fuzzy matching as main search
-                                fuzzy_scores = advanced_fuzzy_match(corrected_song_name, song_info.get('artist', ''), track)
-                                
-                                # Calculate confidence using the same method as main search
-                                fallback_confidence = calculate_confidence_score(
-                                    song_info.get('gemini_confidence', 0.5),
-                                    fuzzy_scores,
-                                    'song_only',  # Fallback is always song-only search
-                                    song_info.get('channel_name')
-                                )
-                                
-                                print(f"Fallback validation: '{corrected_song_name}' vs '{track['name']}'")
-                                print(f"Fuzzy scores: {fuzzy_scores}")
-                                print(f"Fallback confidence: {fallback_confidence:.3f}")
-                                
-                                # Only include tracks with reasonable similarity
-                                if fuzzy_scores.get('title_simple_ratio', 0) >= 20:  # At least 20% similarity
-                                    fallback_tracks.append({
-                                        'track': track,
-                                        'confidence': fallback_confidence,
-                                        'fuzzy_scores': fuzzy_scores
-                                    })
+                        fallback_tracks.append({
+                            'track': track,
+                            'confidence': fallback_confidence,
+                            'fuzzy_scores': fuzzy_scores
+                        })
+                    
+                    # Top 3 most relevant by confidence (partial sort, same order as sorting the whole list)
+                    fallback_tracks = heapq.nlargest(3, fallback_tracks, key=itemgetter('confidence'))
+                    
+                    # Store fallback results for user confirmation
+                    if fallback_tracks:
+                        logger.debug('Found %s relevant fallback tracks', len(fallback_tracks))
+                        # The original title is the same for every candidate - normalize it once
+                        original_title_lower = original_title.lower()
+                        for i, fallback_data in enumerate(fallback_tracks):
+                            track = fallback_data['track']
+                            confidence = fallback_data['confidence']
+                            logger.debug("Fallback %s: '%s' by %s (confidence: %.3f)", i+1, track['name'], track['artists'][0]['name'], confidence)
                             
-                            # Sort by confidence and take top 3
-                            fallback_tracks.sort(key=lambda x: x['confidence'], reverse=True)
-                            fallback_tracks = fallback_tracks[:3]  # Top 3 most relevant
+                            # Calculate title similarity for user comparison
+                            spotify_title = track['name']
+                            title_similarity = fuzz.ratio(original_title_lower, spotify_title.lower())
                             
-                            # Store fallback results for user confirmation
-                            if fallback_tracks:
-                                print(f"Found {len(fallback_tracks)} relevant fallback tracks")
-                                for i, fallback_data in enumerate(fallback_tracks):
-                                    track = fallback_data['track']
-                                    confidence = fallback_data['confidence']
-                                    print(f"Fallback {i+1}: '{track['name']}' by {track['artists'][0]['name']} (confidence: {confidence:.3f})")
-                                    
-                                    # Calculate title similarity for user comparison
-                                    original_title = song_info.get('original_title', song_info['title'])
-                                    spotify_title = track['name']
-                                    title_similarity = fuzz.ratio(original_title.lower(), spotify_title.lower())
-                                    
-                                    # Add to pending tracks for user confirmation
-                                    pending_tracks.append({
-                                        'song_info': song_info,
-                                        'spotify_track': track,
-                                        'confidence': confidence,
-                                        'search_strategy': 'fallback',
-                                        'fuzzy_scores': fallback_data['fuzzy_scores'],
-                                        'title_comparison': {
-                                            'original_youtube_title': original_title,
-                                            'spotify_title': spotify_title,
-                                            'similarity_percentage': title_similarity,
-                                            'is_similar': title_similarity >= 50  # 50%+ similarity
-                                        }
-                                    })
-                            else:
-                                print("No relevant fallback tracks found - will skip this song")
-                                # Add to pending tracks as "no match found"
-                                pending_tracks.append({
-                                    'song_info': song_info,
-                                    'spotify_track': None,
-                                    'confidence': 0.0,
-                                    'search_strategy': 'no_match',
-                                    'fuzzy_scores': {}
-                                })
+                            # Add to pending tracks for user confirmation
+                            pending_tracks.append({
+                                'song_info': song_info,
+                                'spotify_track': track,
+                                'confidence': confidence,
+                                'search_strategy': 'fallback',
+                                'fuzzy_scores': fallback_data['fuzzy_scores'],
+                                'title_comparison': {
+                                    'original_youtube_title': original_title,
+                                    'spotify_title': spotify_title,
+                                    'similarity_percentage': title_similarity,
+                                    'is_similar': title_similarity >= 50  # 50%+ similarity
+                                }
+                            })
+                    else:
+                        logger.debug("No relevant fallback tracks found - will skip this song")
+                        # Add to pending tracks as "no match found"
+                        pending_tracks.append({
+                            'song_info': song_info,
+                            'spotify_track': None,
+                            'confidence': 0.0,
+                            'search_strategy': 'no_match',
+                            'fuzzy_scores': {}
+                        })
             except Exception as song_error:
                 print(f"Error processing song '{song_info['title']}': {song_error}")
                 continue
         
+        # Add all matched tracks with one API call per SPOTIFY_ADD_ITEMS_BATCH_SIZE tracks; tracks that
+        # could not be added go to the user for confirmation instead
+        feedback_rows = []
+        if queued_tracks and playlist.platform_playlist_id:
+            failed_uris = add_tracks_to_spotify_playlist(
+                sp, playlist.platform_playlist_id, [track_uri for track_uri, _, _ in queued_tracks]
+            )
+            for track_uri, pending_entry, feedback_row in queued_tracks:
+                if track_uri in failed_uris:
+                    pending_tracks.append(pending_entry)
+                else:
+                    songs_added += 1
+                    if feedback_row:
+                        feedback_rows.append(feedback_row)
+        
+        if len(pending_tracks) != pending_count:
+            save_pending_tracks(pending_tracks)
+        
+        # Feedback for all auto-added matches in one executemany INSERT and one transaction
+        if feedback_rows:
+            try:
+                db.session.execute(UserFeedback.__table__.insert(), feedback_rows)
+                db.session.commit()
+            except Exception as feedback_error:
+                db.session.rollback()
+                print(f"Error saving match feedback: {feedback_error}")
+        
         # Final verification - check total tracks in playlist
         try:
-            final_playlist_check = sp.playlist_tracks(playlist.platform_playlist_id, limit=1, offset=0)
+            final_playlist_check = sp.playlist_items(playlist.platform_playlist_id, fields='total', limit=1, offset=0)
             print(f"🔍 FINAL VERIFICATION - Playlist '{playlist.name}' now has {final_playlist_check['total']} total tracks")
         except Exception as final_error:
             print(f"🔍 FINAL VERIFICATION - Could not check final playlist count: {final_error}")
@@ -1439,6 +2116,84 @@ def update_spotify_playlist(access_token, playlist, songs_to_add):
         print(f"Error updating Spotify playlist: {e}")
         return 0
 
+def add_video_to_youtube_playlist(headers, youtube_playlist_id, video_id):
+    """Insert one video into a YouTube playlist over the shared keep-alive session
+    
+    Only the new item's id is requested back - the full snippet with thumbnails is never read.
+    """
+    with youtube_rate_limiter:
+        return http_session.post(
+            'https://www.googleapis.com/youtube/v3/playlistItems',
+            headers=headers,
+            params={'part': 'snippet', 'fields': 'id'},
+            # orjson encodes straight to bytes (the callers' headers already set application/json)
+            data=orjson.dumps({
+                'snippet': {
+                    'playlistId': youtube_playlist_id,
+                    'resourceId': {
+                        'kind': 'youtube#video',
+                        'videoId': video_id
+                    }
+                }
+            })
+        )
+
+_BATCH_ITEM_RE = re.compile(r"item-(\d+)")
+_HTTP_STATUS_RE = re.compile(r"HTTP/[\d.]+ (\d{3})")
+
+def add_videos_to_youtube_playlist_batch(headers, youtube_playlist_id, video_ids):
+    """Insert up to YOUTUBE_BATCH_SIZE videos into a YouTube playlist with one multipart batch request
+    
+    Returns the HTTP status code of each insert in the order of video_ids (None where the batch
+    request failed or a sub-response is missing).
+    """
+    boundary = f"batch_{uuid.uuid4().hex}"
+    parts = []
+    for index, video_id in enumerate(video_ids):
+        body = orjson.dumps({
+            'snippet': {
+                'playlistId': youtube_playlist_id,
+                'resourceId': {
+                    'kind': 'youtube#video',
+                    'videoId': video_id
+                }
+            }
+        }).decode()
+        parts.append(
+            f"--{boundary}\r\n"
+            "Content-Type: application/http\r\n"
+            f"Content-ID: <item-{index}>\r\n\r\n"
+            "POST /youtube/v3/playlistItems?part=snippet&fields=id HTTP/1.1\r\n"
+            "Content-Type: application/json\r\n\r\n"
+            f"{body}\r\n"
+        )
+    parts.append(f"--{boundary}--\r\n")
+    
+    statuses = [None] * len(video_ids)
+    with youtube_rate_limiter:
+        response = http_session.post(
+            YOUTUBE_BATCH_URL,
+            headers={
+                'Authorization': headers['Authorization'],
+                'Content-Type': f'multipart/mixed; boundary={boundary}'
+            },
+            data=''.join(parts).encode()
+        )
+    if response.status_code != 200:
+        print(f"YouTube batch insert failed: {response.status_code} - {response.text}")
+        return statuses
+    
+    # Each sub-response is an application/http part whose Content-ID echoes ours as <response-item-N>
+    message = BytesParser().parsebytes(
+        f"Content-Type: {response.headers.get('Content-Type', '')}\r\n\r\n".encode() + response.content
+    )
+    for part in message.get_payload():
+        item = _BATCH_ITEM_RE.search(part.get('Content-ID', ''))
+        status = _HTTP_STATUS_RE.match(part.get_payload().lstrip())
+        if item and status and int(item.group(1)) < len(statuses):
+            statuses[int(item.group(1))] = int(status.group(1))
+    return statuses
+
 def update_youtube_playlist_direct(access_token, target_playlist, songs_to_add, source_playlist):
     """Direct YouTube → YouTube sync using video IDs (no search needed)"""
     print(f"=== update_youtube_playlist_direct CALLED ===")
@@ -1447,8 +2202,6 @@ def update_youtube_playlist_direct(access_token, target_playlist, songs_to_add,
     print("🎯 Using direct video ID mapping - no search required!")
     
     try:
-        import requests
-        
         headers = {
             'Authorization': f'Bearer {access_token}',
             'Accept': 'application/json',
@@ -1462,75 +2215,192 @@ def update_youtube_playlist_direct(access_token, target_playlist, songs_to_add,
         
         songs_added = 0
         
+        # YouTube video IDs of all songs from their PlatformSong mappings, in one query joined on the
+        # source playlist (no IN list with one bound parameter per song)
+        youtube_platform = get_platform_by_name('YouTube')
+        video_ids_by_song = dict(
+            db.session.query(PlatformSong.song_id, PlatformSong.platform_specific_id).join(
+                PlaylistSong, PlaylistSong.song_id == PlatformSong.song_id
+            ).filter(
+                PlaylistSong.playlist_id == source_playlist.playlist_id,
+                PlatformSong.platform_id == youtube_platform.platform_id,
+                PlatformSong.platform_specific_id.isnot(None)
+            )
+        ) if youtube_platform else {}
+        
+        songs_to_insert = []
         for song_info in songs_to_add:
+            video_id = video_ids_by_song.get(song_info['song_id'])
+            if not video_id:
+                print(f"❌ No video ID found for song: {song_info['title']}")
+                continue
+            logger.debug("🎯 Direct mapping: '%s' → Video ID: %s", song_info['title'], video_id)
+            songs_to_insert.append((song_info, video_id))
+        
+        # Add videos directly to target playlist, up to 50 inserts per batch request. The API applies
+        # a batch's sub-requests in no guaranteed order, so unlike the sequential path the target
+        # playlist does not keep the source order within a batch
+        for start in range(0, len(songs_to_insert), YOUTUBE_BATCH_SIZE):
+            batch = songs_to_insert[start:start + YOUTUBE_BATCH_SIZE]
             try:
-                # Get the YouTube video ID from the source playlist's PlatformSong
-                platform_song = PlatformSong.query.join(Platform).filter(
-                    PlatformSong.song_id == song_info['song_id'],
-                    Platform.platform_name == 'YouTube',
-                    PlatformSong.platform_id == Platform.platform_id
-                ).first()
-                
-                if not platform_song or not platform_song.platform_specific_id:
-                    print(f"❌ No video ID found for song: {song_info['title']}")
-                    continue
-                
-                video_id = platform_song.platform_specific_id
-                print(f"🎯 Direct mapping: '{song_info['title']}' → Video ID: {video_id}")
-                
-                # Add video directly to target playlist using video ID
-                add_data = {
-                    'snippet': {
-                        'playlistId': youtube_playlist_id,
-                        'resourceId': {
-                            'kind': 'youtube#video',
-                            'videoId': video_id
-                        }
-                    }
-                }
-                
-                add_response = requests.post(
-                    'https://www.googleapis.com/youtube/v3/playlistItems?part=snippet',
-                    headers=headers,
-                    data=json.dumps(add_data)
+                statuses = add_videos_to_youtube_playlist_batch(
+                    headers, youtube_playlist_id, [video_id for _, video_id in batch]
                 )
-                
-                print(f"YouTube direct add response: {add_response.status_code}")
-                if add_response.status_code == 200:
-                    songs_added += 1
-                    print(f"✅ Direct added: '{song_info['title']}' (Video ID: {video_id})")
-                elif add_response.status_code == 409:
-                    print(f"⚠️ Video already exists in playlist: '{song_info['title']}' (Video ID: {video_id})")
-                    songs_added += 1  # Count as success since it's already there
-                else:
-                    print(f"❌ Failed to add '{song_info['title']}': {add_response.text}")
+            except Exception as batch_error:
+                print(f"❌ YouTube batch insert error: {batch_error}")
+                statuses = [None] * len(batch)
+            
+            for (song_info, video_id), status_code in zip(batch, statuses):
+                try:
+                    add_response = None
+                    if status_code != 200:
+                        # Inserts the batch could not apply are retried one at a time - a 409 inside
+                        # a batch aimed at one playlist is usually an insert aborted by the other
+                        # sub-requests modifying the same playlist, not a duplicate
+                        add_response = add_video_to_youtube_playlist(headers, youtube_playlist_id, video_id)
+                        status_code = add_response.status_code
                     
-            except Exception as song_error:
-                print(f"❌ Error adding song '{song_info['title']}': {song_error}")
+                    logger.debug('YouTube direct add response: %s', status_code)
+                    if status_code == 200:
+                        songs_added += 1
+                        logger.debug("✅ Direct added: '%s' (Video ID: %s)", song_info['title'], video_id)
+                    elif status_code == 409:
+                        logger.debug("⚠️ Video already exists in playlist: '%s' (Video ID: %s)", song_info['title'], video_id)
+                        songs_added += 1  # Count as success since it's already there
+                    else:
+                        print(f"❌ Failed to add '{song_info['title']}': {add_response.text}")
+                        
+                except Exception as song_error:
+                    print(f"❌ Error adding song '{song_info['title']}': {song_error}")
+                    continue
+        
+        print(f"🎯 Direct sync completed: {songs_added}/{len(songs_to_add)} songs added")
+        return songs_added
+        
+    except Exception as e:
+        print(f"❌ Direct YouTube sync failed: {str(e)}")
+        return 0
+
+def search_youtube_video(headers, song_info):
+    """Search YouTube for a song, returns (search response, video id or None)"""
+    try:
+        search_params = {
+            'part': 'snippet',
+            'q': f"{song_info['title']} {song_info['artist']}",
+            'type': 'video',
+            'maxResults': 1,
+            'fields': 'items(id/videoId)'
+        }
+        
+        with youtube_rate_limiter:
+            search_response = http_session.get('https://www.googleapis.com/youtube/v3/search', headers=headers, params=search_params)
+        logger.debug("YouTube search response for '%s': %s", song_info['title'], search_response.status_code)
+        
+        video_id = None
+        if search_response.status_code == 200:
+            items = search_response.json().get('items')
+            if items:
+                video_id = items[0]['id']['videoId']
+        return search_response, video_id
+    except Exception as e:
+        print(f"Error searching YouTube for '{song_info['title']}': {e}")
+        return None, None
+
+def get_known_youtube_video_ids(songs):
+    """Map (title, artist) to the YouTube video id already stored for the same song of the current user
+    
+    Songs resolved by an earlier search keep a YouTube PlatformSong mapping, so repeat syncs skip the
+    100-unit search call for them.
+    """
+    youtube_platform = get_platform_by_name('YouTube')
+    titles = list({song_info['title'] for song_info in songs})
+    known_video_ids = {}
+    if not youtube_platform:
+        return known_video_ids
+    
+    for start in range(0, len(titles), DB_WRITE_CHUNK_SIZE):
+        rows = db.session.query(Song.title, Song.artist, PlatformSong.platform_specific_id).join(
+            PlatformSong, PlatformSong.song_id == Song.song_id
+        ).filter(
+            Song.user_id == current_user.user_id,
+            Song.title.in_(titles[start:start + DB_WRITE_CHUNK_SIZE]),
+            PlatformSong.platform_id == youtube_platform.platform_id,
+            PlatformSong.platform_specific_id.isnot(None)
+        ).order_by(PlatformSong.platform_song_id.desc())  # Newest mapping first
+        for title, artist, video_id in rows:
+            known_video_ids.setdefault((title, artist), video_id)
+    return known_video_ids
+
+def save_youtube_video_mappings(video_ids_by_song):
+    """Store search hits as YouTube PlatformSong mappings (song_id -> video id)
+    
+    A song that already has a YouTube mapping - one whose video became unavailable - gets it updated
+    in place instead of a second row, so later syncs do not keep finding the stale id.
+    """
+    youtube_platform = get_platform_by_name('YouTube')
+    if not youtube_platform or not video_ids_by_song:
+        return
+    
+    song_ids = list(video_ids_by_song)
+    mapped_song_ids = set()
+    for start in range(0, len(song_ids), DB_WRITE_CHUNK_SIZE):
+        mapped_song_ids.update(song_id for (song_id,) in db.session.query(PlatformSong.song_id).filter(
+            PlatformSong.platform_id == youtube_platform.platform_id,
+            PlatformSong.song_id.in_(song_ids[start:start + DB_WRITE_CHUNK_SIZE])
+        ))
+    
+    updates = [
+        {'b_song_id': song_id, 'b_video_id': video_id}
+        for song_id, video_id in video_ids_by_song.items() if song_id in mapped_song_ids
+    ]
+    inserts = [
+        {'song_id': song_id, 'platform_id': youtube_platform.platform_id, 'platform_specific_id': video_id}
+        for song_id, video_id in video_ids_by_song.items() if song_id not in mapped_song_ids
+    ]
+    if updates:
+        db.session.execute(
+            PlatformSong.__table__.update().where(
+                PlatformSong.song_id == bindparam('b_song_id'),
+                PlatformSong.platform_id == youtube_platform.platform_id
+            ).values(platform_specific_id=bindparam('b_video_id')),
+            updates
+        )
+    if inserts:
+        db.session.execute(PlatformSong.__table__.insert(), inserts)
+
+def get_available_youtube_video_ids(headers, video_ids):
+    """Return which of the video ids still exist, checked with videos.list (1 quota unit per 50 ids)
+    
+    Ids of a chunk whose lookup fails are all treated as available, as they were before the check.
+    """
+    video_ids = list(dict.fromkeys(video_ids))
+    available = set()
+    for start in range(0, len(video_ids), YOUTUBE_BATCH_SIZE):
+        chunk = video_ids[start:start + YOUTUBE_BATCH_SIZE]
+        try:
+            with youtube_rate_limiter:
+                response = http_session.get(
+                    'https://www.googleapis.com/youtube/v3/videos',
+                    headers=headers,
+                    params={'part': 'id', 'id': ','.join(chunk), 'maxResults': YOUTUBE_BATCH_SIZE, 'fields': 'items(id)'}
+                )
+            if response.status_code == 200:
+                available.update(item['id'] for item in response.json().get('items', []))
                 continue
-        
-        print(f"🎯 Direct sync completed: {songs_added}/{len(songs_to_add)} songs added")
-        return songs_added
-        
-    except Exception as e:
-        print(f"❌ Direct YouTube sync failed: {str(e)}")
-        return 0
+            print(f"YouTube videos lookup failed: {response.status_code} - {response.text}")
+        except Exception as e:
+            print(f"Error checking YouTube videos: {e}")
+        available.update(chunk)
+    return available
 
 def update_youtube_playlist(access_token, playlist, songs_to_add):
     """Update a YouTube playlist with new songs (simplified version)"""
-    print(f"=== update_youtube_playlist CALLED ===")
-    print(f"Playlist: {playlist.name}")
-    print(f"Songs to add: {len(songs_to_add)}")
-    
     # Log to file
-    with open('/tmp/sync_debug.log', 'a') as f:
-        f.write(f"=== update_youtube_playlist CALLED ===\n")
-        f.write(f"Playlist: {playlist.name}\n")
-        f.write(f"Songs to add: {len(songs_to_add)}\n")
+    sync_debug_log.debug("=== update_youtube_playlist CALLED ===")
+    sync_debug_log.debug("Playlist: %s", playlist.name)
+    sync_debug_log.debug("Songs to add: %s", len(songs_to_add))
     
     try:
-        import requests
-        
         headers = {
             'Authorization': f'Bearer {access_token}',
             'Accept': 'application/json',
@@ -1543,59 +2413,67 @@ def update_youtube_playlist(access_token, playlist, songs_to_add):
             return 0
         
         songs_added = 0
-        search_url = "https://www.googleapis.com/youtube/v3/search"
         
-        for song_info in songs_to_add:
-            try:
-                # Search for the song on YouTube
-                search_params = {
-                    'part': 'snippet',
-                    'q': f"{song_info['title']} {song_info['artist']}",
-                    'type': 'video',
-                    'maxResults': 1
-                }
-                
-                search_response = requests.get(search_url, headers=headers, params=search_params)
-                print(f"YouTube search response for '{song_info['title']}': {search_response.status_code}")
-                
-                if search_response.status_code == 200:
-                    search_data = search_response.json()
-                    
-                    if search_data.get('items'):
-                        video_id = search_data['items'][0]['id']['videoId']
-                        print(f"Found YouTube video ID: {video_id} for '{song_info['title']}'")
+        # Video ids found by earlier syncs are reused; new search hits are stored after the loop
+        known_video_ids = get_known_youtube_video_ids(songs_to_add)
+        if known_video_ids:
+            # Stored videos may have been deleted or made private since - those songs are searched again
+            available = get_available_youtube_video_ids(headers, known_video_ids.values())
+            known_video_ids = {key: video_id for key, video_id in known_video_ids.items() if video_id in available}
+        new_video_ids = {}  # song_id -> video id found by search
+        
+        def find_video(song_info):
+            """(search response, video id) - the response is None for a known video id"""
+            video_id = known_video_ids.get((song_info['title'], song_info['artist']))
+            if video_id:
+                return None, video_id
+            return search_youtube_video(headers, song_info)
+        
+        # Searches are independent network calls, so run them concurrently with a bounded pool
+        # (the worker count doubles as the rate limit); adds stay sequential to keep playlist order.
+        # Results are consumed in order as they arrive, so adding the first songs overlaps with
+        # the remaining searches instead of waiting for all of them
+        with ThreadPoolExecutor(max_workers=YOUTUBE_SEARCH_MAX_WORKERS) as executor:
+            search_results = executor.map(find_video, songs_to_add)
+            
+            for song_info, (search_response, video_id) in zip(songs_to_add, search_results):
+                try:
+                    if video_id:
+                        if search_response is None:
+                            logger.debug("Using stored YouTube video ID: %s for '%s'", video_id, song_info['title'])
+                        else:
+                            logger.debug("Found YouTube video ID: %s for '%s'", video_id, song_info['title'])
+                            if song_info.get('song_id'):
+                                new_video_ids[song_info['song_id']] = video_id
                         
                         # Add video to playlist
-                        add_data = {
-                            'snippet': {
-                                'playlistId': youtube_playlist_id,
-                                'resourceId': {
-                                    'kind': 'youtube#video',
-                                    'videoId': video_id
-                                }
-                            }
-                        }
+                        add_response = add_video_to_youtube_playlist(headers, youtube_playlist_id, video_id)
                         
-                        add_response = requests.post(
-                            'https://www.googleapis.com/youtube/v3/playlistItems?part=snippet',
-                            headers=headers,
-                            data=json.dumps(add_data)
-                        )
-                        
-                        print(f"YouTube add to playlist response: {add_response.status_code}")
+                        logger.debug('YouTube add to playlist response: %s', add_response.status_code)
                         if add_response.status_code == 200:
                             songs_added += 1
-                            print(f"Added '{song_info['title']}' to YouTube playlist")
+                            logger.debug("Added '%s' to YouTube playlist", song_info['title'])
                         else:
                             print(f"Failed to add '{song_info['title']}' to YouTube playlist: {add_response.text}")
-                    else:
+                    elif search_response is None:
+                        continue
+                    elif search_response.status_code == 200:
                         print(f"No YouTube video found for: {song_info['title']} by {song_info['artist']}")
-                else:
-                    print(f"YouTube search failed for: {song_info['title']} - {search_response.text}")
+                    else:
+                        print(f"YouTube search failed for: {song_info['title']} - {search_response.text}")
                     
-            except Exception as song_error:
-                print(f"Error adding song '{song_info['title']}' to YouTube: {song_error}")
-                continue
+                except Exception as song_error:
+                    print(f"Error adding song '{song_info['title']}' to YouTube: {song_error}")
+                    continue
+        
+        # Search hits stored as YouTube mappings (executemany UPDATE/INSERT), so the next sync reuses them
+        if new_video_ids:
+            try:
+                save_youtube_video_mappings(new_video_ids)
+                db.session.commit()
+            except Exception as mapping_error:
+                db.session.rollback()
+                print(f"Error saving YouTube video mappings: {mapping_error}")
         
         return songs_added
         
@@ -1611,7 +2489,7 @@ def sync_playlist_cross_platform(source_playlist, target_playlist, source_platfo
         target_account = None
         
         for account in user_accounts:
-            platform = db.session.get(Platform, account.platform_id)
+            platform = get_platform(account.platform_id)
             if platform.platform_name == source_platform:
                 source_account = account
             elif platform.platform_name == target_platform:
@@ -1620,37 +2498,27 @@ def sync_playlist_cross_platform(source_playlist, target_playlist, source_platfo
         if not source_account or not target_account:
             return False, "Missing platform connections"
         
-        # Get songs from source playlist
-        source_songs = []
-        playlist_songs = PlaylistSong.query.filter_by(playlist_id=source_playlist.playlist_id).all()
+        # Get songs from source playlist in one joined query, reading only the columns the sync needs
+        songs = db.session.query(Song.song_id, Song.title, Song.artist, Song.album, Song.duration).join(
+            PlaylistSong, PlaylistSong.song_id == Song.song_id
+        ).filter(
+            PlaylistSong.playlist_id == source_playlist.playlist_id,
+            Song.user_id == current_user.user_id  # ✅ USER ISOLATION CHECK
+        )
         
-        for ps in playlist_songs:
-            song = db.session.get(Song, ps.song_id)
-            if song and song.user_id == current_user.user_id:  # ✅ USER ISOLATION CHECK
-                source_songs.append({
-                    'song_id': song.song_id,  # Add song_id for tracking
-                    'title': song.title,
-                    'artist': song.artist,
-                    'album': song.album,
-                    'duration': song.duration
-                })
+        source_songs = [
+            {
+                'song_id': song_id,  # Add song_id for tracking
+                'title': title,
+                'artist': artist,
+                'album': album,
+                'duration': duration
+            }
+            for song_id, title, artist, album, duration in songs
+        ]
         
         print(f"🔄 Starting sync: {len(source_songs)} songs from {source_platform} to {target_platform}")
         
-        # Create sync log entry BEFORE starting sync
-        sync_log = SyncLog(
-            user_id=current_user.user_id,
-            source_account_id=source_account.account_id,
-            destination_account_id=target_account.account_id,
-            playlist_id=source_playlist.playlist_id,
-            total_songs_synced=len(source_songs),
-            songs_added=0,  # Will be updated after sync
-            songs_removed=0,
-            timestamp=datetime.now().date()
-        )
-        db.session.add(sync_log)
-        db.session.flush()  # Get the sync_id
-        
         # Add songs to target platform
         songs_added = 0
         songs_failed = 0
@@ -1667,30 +2535,33 @@ def sync_playlist_cross_platform(source_playlist, target_playlist, source_platfo
         # Calculate failed songs
         songs_failed = len(source_songs) - songs_added
         
-        # Update sync log with actual results
-        sync_log.songs_added = songs_added
-        sync_log.songs_removed = 0  # Cross-platform sync doesn't remove songs
-        
-        # Create individual song tracking entries
-        for i, song_data in enumerate(source_songs):
-            if i < songs_added:
-                # Song was successfully added
-                sync_song = SyncSong(
-                    sync_id=sync_log.sync_id,
-                    song_id=song_data['song_id'],
-                    action='added',
-                    timestamp=datetime.now()
-                )
-                db.session.add(sync_song)
-            else:
-                # Song failed to be added
-                sync_song = SyncSong(
-                    sync_id=sync_log.sync_id,
-                    song_id=song_data['song_id'],
-                    action='failed',
-                    timestamp=datetime.now()
-                )
-                db.session.add(sync_song)
+        # Create the sync log with the actual results only now, in one short transaction, so no
+        # write transaction is held open across the API calls above. The counters are stored on
+        # the log so sync_details never has to COUNT the SyncSong rows
+        sync_log = SyncLog(
+            user_id=current_user.user_id,
+            source_account_id=source_account.account_id,
+            destination_account_id=target_account.account_id,
+            playlist_id=source_playlist.playlist_id,
+            total_songs_synced=len(source_songs),
+            songs_added=songs_added,
+            songs_removed=0,  # Cross-platform sync doesn't remove songs
+            timestamp=datetime.now().date()
+        )
+        db.session.add(sync_log)
+        db.session.flush()  # Get the sync_id
+        
+        # Create individual song tracking entries (one executemany INSERT, committed with the log)
+        sync_time = datetime.now()
+        if source_songs:
+            db.session.execute(
+                SyncSong.__table__.insert(),
+                [{'sync_id': sync_log.sync_id,
+                  'song_id': song_data['song_id'],
+                  'action': 'added' if i < songs_added else 'failed',
+                  'timestamp': sync_time}
+                 for i, song_data in enumerate(source_songs)]
+            )
         
         db.session.commit()
         
@@ -1706,6 +2577,7 @@ def sync_playlist_cross_platform(source_playlist, target_playlist, source_platfo
 # Database Models
 class User(UserMixin, db.Model):
     __tablename__ = 'User_'
+    is_admin = False  # plain class attribute so admin checks are a simple lookup
     user_id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(100), nullable=False)
     email = db.Column(db.String(100), unique=True, nullable=False)
@@ -1717,6 +2589,7 @@ class User(UserMixin, db.Model):
         return str(self.user_id)
 
 class Admin(UserMixin, db.Model):
+    is_admin = True
     admin_id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(100), nullable=False)
     email = db.Column(db.String(100), unique=True, nullable=False)
@@ -1733,6 +2606,9 @@ class Platform(db.Model):
     platform_songs = db.relationship('PlatformSong', backref='platform', lazy=True)
 
 class UserPlatformAccount(db.Model):
+    __table_args__ = (
+        db.Index('ix_upa_userid', 'user_id'),  # dashboard, logout and ownership checks filter by user
+    )
     account_id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey('User_.user_id'), nullable=False)
     platform_id = db.Column(db.Integer, db.ForeignKey('platform.platform_id'), nullable=False)
@@ -1751,16 +2627,22 @@ class Playlist(db.Model):
     sync_logs = db.relationship('SyncLog', backref='playlist', lazy=True)
 
 class Song(db.Model):
+    __table_args__ = (
+        db.Index('ix_song_userid_title', 'user_id', 'title'),  # per-user library and title lookups
+    )
     song_id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey('User_.user_id'), nullable=False)  # ✅ USER ISOLATION
-    title = db.Column(db.String(200), nullable=False)
+    title = db.Column(db.String(200), nullable=False)  # YouTube songs keep the original video title here, unparsed
     artist = db.Column(db.String(150))
-    album = db.Column(db.String(150))
+    album = db.Column(db.String(150))  # Plain album name ("YouTube" for YouTube songs), never encodes other metadata
     duration = db.Column(db.Integer)
     playlist_songs = db.relationship('PlaylistSong', backref='song', lazy=True)
     platform_songs = db.relationship('PlatformSong', backref='song', lazy=True)
 
 class PlatformSong(db.Model):
+    __table_args__ = (
+        db.Index('ix_platformsong_song_platform', 'song_id', 'platform_id'),  # song -> platform id mappings
+    )
     platform_song_id = db.Column(db.Integer, primary_key=True)
     song_id = db.Column(db.Integer, db.ForeignKey('song.song_id'), nullable=False)
     platform_id = db.Column(db.Integer, db.ForeignKey('platform.platform_id'), nullable=False)
@@ -1781,6 +2663,8 @@ class SyncLog(db.Model):
     songs_added = db.Column(db.Integer)
     songs_removed = db.Column(db.Integer)
     timestamp = db.Column(db.Date, default=lambda: datetime.now().date())
+    source_account = db.relationship('UserPlatformAccount', foreign_keys=[source_account_id])
+    destination_account = db.relationship('UserPlatformAccount', foreign_keys=[destination_account_id])
 
 class SyncSong(db.Model):
     """Table to track exactly which songs were synced in each sync operation"""
@@ -1806,6 +2690,105 @@ class UserFeedback(db.Model):
     timestamp = db.Column(db.DateTime, default=datetime.now)
     used_for_training = db.Column(db.Boolean, default=False)
 
+def insert_ignore_duplicates(model, rows, index_elements):
+    """Insert rows in multi-row statements, letting the database skip rows that violate a unique key"""
+    if not rows:
+        return
+    
+    # Each statement binds every value, so large inputs are split to stay under the
+    # database's bound-parameter limit (999 on older SQLite builds)
+    chunk_size = min(DB_WRITE_CHUNK_SIZE, 999 // len(rows[0]))
+    for start in range(0, len(rows), chunk_size):
+        _insert_ignore_duplicates_chunk(model, rows[start:start + chunk_size], index_elements)
+
+def _insert_ignore_duplicates_chunk(model, rows, index_elements):
+    """Insert one chunk of rows for insert_ignore_duplicates"""
+    dialect = db.engine.dialect.name
+    if dialect == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert
+        stmt = insert(model).values(rows).on_conflict_do_nothing(index_elements=index_elements)
+    elif dialect == 'sqlite':
+        from sqlalchemy.dialects.sqlite import insert
+        stmt = insert(model).values(rows).on_conflict_do_nothing(index_elements=index_elements)
+    elif dialect in ('mysql', 'mariadb'):
+        stmt = model.__table__.insert().values(rows).prefix_with('IGNORE')
+    else:
+        # Unknown dialect - fall back to checking existing keys before inserting
+        from sqlalchemy import tuple_
+        columns = [getattr(model, column) for column in index_elements]
+        keys = {tuple(row[column] for column in index_elements) for row in rows}
+        existing = set(db.session.query(*columns).filter(tuple_(*columns).in_(list(keys))).all())
+        rows = [row for row in rows if tuple(row[column] for column in index_elements) not in existing]
+        if not rows:
+            return
+        stmt = model.__table__.insert().values(rows)
+
+    db.session.execute(stmt)
+
+# Platform lookup cache - the Platform table holds a handful of rows that never change,
+# so it is loaded once per process instead of being queried in every request
+PlatformInfo = namedtuple('PlatformInfo', ['platform_id', 'platform_name', 'api_details'])
+PLATFORMS_BY_ID = {}
+PLATFORMS_BY_NAME = {}
+
+def reload_platform_cache():
+    """Load all platforms into the in-process lookup dicts"""
+    global PLATFORMS_BY_ID, PLATFORMS_BY_NAME
+    platforms_by_id = {
+        p.platform_id: PlatformInfo(p.platform_id, p.platform_name, p.api_details)
+        for p in Platform.query.all()
+    }
+    PLATFORMS_BY_ID = platforms_by_id
+    PLATFORMS_BY_NAME = {p.platform_name: p for p in platforms_by_id.values()}
+
+def ensure_platform(platform_name, api_details):
+    """Get a cached platform by name, creating its row (and refreshing the cache) if it is missing"""
+    platform = get_platform_by_name(platform_name)
+    if platform is None:
+        db.session.add(Platform(platform_name=platform_name, api_details=api_details))
+        db.session.commit()
+        reload_platform_cache()
+        platform = PLATFORMS_BY_NAME.get(platform_name)
+    return platform
+
+def get_all_platforms():
+    """All cached platforms (loads the cache if this process has not yet)"""
+    if not PLATFORMS_BY_ID:
+        reload_platform_cache()
+    return list(PLATFORMS_BY_ID.values())
+
+def fetch_songs_by_id(song_ids):
+    """Fetch songs with a single IN query, returned as a dict keyed by song_id"""
+    if not song_ids:
+        return {}
+    songs = Song.query.filter(Song.song_id.in_(set(song_ids))).all()
+    return {song.song_id: song for song in songs}
+
+def get_owned_playlist(playlist_id):
+    """Get (playlist, platform account) for a playlist owned by the current user, or None"""
+    return db.session.query(Playlist, UserPlatformAccount).join(
+        UserPlatformAccount, Playlist.account_id == UserPlatformAccount.account_id
+    ).filter(
+        Playlist.playlist_id == playlist_id,
+        UserPlatformAccount.user_id == current_user.user_id
+    ).first()
+
+def get_platform(platform_id):
+    """Get a cached platform by id (reloads the cache once on a miss)"""
+    platform = PLATFORMS_BY_ID.get(platform_id)
+    if platform is None:
+        reload_platform_cache()
+        platform = PLATFORMS_BY_ID.get(platform_id)
+    return platform
+
+def get_platform_by_name(platform_name):
+    """Get a cached platform by name (reloads the cache once on a miss)"""
+    platform = PLATFORMS_BY_NAME.get(platform_name)
+    if platform is None:
+        reload_platform_cache()
+        platform = PLATFORMS_BY_NAME.get(platform_name)
+    return platform
+
 @login_manager.user_loader
 def load_user(user_id):
     # Try to load regular user first
@@ -1884,7 +2867,7 @@ def register():
         email = request.form['email']
         password = request.form['password']
         
-        if User.query.filter_by(email=email).first():
+        if db.session.query(User.query.filter_by(email=email).exists()).scalar():
             flash('Email already exists')
             return render_template('register.html')
         
@@ -2015,33 +2998,33 @@ def reset_password():
 @login_required
 def dashboard():
     # Check if current user is admin - redirect to admin dashboard
-    if hasattr(current_user, 'admin_id'):
+    if current_user.is_admin:
         return redirect(url_for('admin_dashboard'))
     
-    # Get user's platform accounts with platform information (only those with valid tokens)
-    user_accounts = UserPlatformAccount.query.filter_by(user_id=current_user.user_id).filter(UserPlatformAccount.auth_token.isnot(None)).all()
+    # Get user's platform accounts with platform information (only those with valid tokens);
+    # their playlists are loaded with one IN query for all accounts
+    user_accounts = UserPlatformAccount.query.options(
+        joinedload(UserPlatformAccount.platform),
+        selectinload(UserPlatformAccount.playlists)
+    ).filter_by(
+        user_id=current_user.user_id
+    ).filter(UserPlatformAccount.auth_token.isnot(None)).all()
+    playlists = [playlist for account in user_accounts for playlist in account.playlists]
     
-    # Add platform information to user accounts
-    for account in user_accounts:
-        account.platform = db.session.get(Platform, account.platform_id)
+    # Count songs of all playlists in one grouped query (the PlaylistSong rows themselves are not needed)
+    song_counts = dict(
+        db.session.query(PlaylistSong.playlist_id, func.count()).filter(
+            PlaylistSong.playlist_id.in_([playlist.playlist_id for playlist in playlists])
+        ).group_by(PlaylistSong.playlist_id)
+    ) if playlists else {}
     
-    # Get playlists for all user accounts with platform and account information
-    playlists = []
     for account in user_accounts:
-        # Get platform information for this account
-        platform = db.session.get(Platform, account.platform_id)
-        
-        account_playlists = Playlist.query.filter_by(account_id=account.account_id).all()
-        for playlist in account_playlists:
-            # Count songs in each playlist
-            song_count = PlaylistSong.query.filter_by(playlist_id=playlist.playlist_id).count()
-            playlist.song_count = song_count
+        for playlist in account.playlists:
+            playlist.song_count = song_counts.get(playlist.playlist_id, 0)
             
             # Add platform and account information to playlist object
-            playlist.platform_name = platform.platform_name if platform else "Unknown"
+            playlist.platform_name = account.platform.platform_name if account.platform else "Unknown"
             playlist.account_username = account.username_on_platform if account.username_on_platform else f"user_{account.user_id}"
-            
-            playlists.append(playlist)
     
     return render_template('dashboard.html', playlists=playlists, user_accounts=user_accounts)
 
@@ -2049,7 +3032,7 @@ def dashboard():
 @login_required
 def admin_dashboard():
     """Simple admin dashboard"""
-    if not hasattr(current_user, 'admin_id'):
+    if not current_user.is_admin:
         return redirect(url_for('dashboard'))
     
     # Get basic statistics
@@ -2070,11 +3053,22 @@ def admin_dashboard():
                          total_songs=total_songs,
                          total_syncs=total_syncs)
 
+@app.route('/reload_platforms')
+@login_required
+def reload_platforms():
+    """Re-read the Platform table into the in-process platform cache (admin only)"""
+    if not current_user.is_admin:
+        return redirect(url_for('dashboard'))
+    
+    reload_platform_cache()
+    flash(f'Platform cache reloaded ({len(PLATFORMS_BY_ID)} platforms).')
+    return redirect(url_for('admin_dashboard'))
+
 @app.route('/connect_platform', methods=['GET', 'POST'])
 @login_required
 def connect_platform():
     # Check if current user is admin - redirect to admin dashboard
-    if hasattr(current_user, 'admin_id'):
+    if current_user.is_admin:
         return redirect(url_for('admin_dashboard'))
     if request.method == 'POST':
         platform_name = request.form['platform']
@@ -2088,32 +3082,14 @@ def connect_platform():
             session[f'spotify_oauth_state_{current_user.user_id}'] = state
             print(f" Generated Spotify OAuth state for user {current_user.user_id}: {state[:10]}...")
             
-            # Clear any existing Spotify cache files to prevent token contamination
-            import os
-            cache_file = f".spotify_cache_user_{current_user.user_id}.cache"
-            if os.path.exists(cache_file):
-                os.remove(cache_file)
-                print(f"🗑️ Cleared existing Spotify cache file for user {current_user.user_id}")
-            
-            # Redirect to Spotify OAuth with user-specific cache path
-            spotify_oauth = SpotifyOAuth(
-                client_id=SPOTIFY_CLIENT_ID,
-                client_secret=SPOTIFY_CLIENT_SECRET,
-                redirect_uri=SPOTIFY_REDIRECT_URI,
-                scope='playlist-read-private playlist-read-collaborative user-read-private playlist-modify-public playlist-modify-private',
-                cache_path=f".spotify_cache_user_{current_user.user_id}.cache"
-            )
-            auth_url = spotify_oauth.get_authorize_url(state=state)
+            # Redirect to Spotify OAuth
+            auth_url = make_spotify_oauth().get_authorize_url(state=state)
             return redirect(auth_url)
         
         elif platform_name == 'YouTube':
             # Redirect to Google OAuth for YouTube
             try:
-                platform = Platform.query.filter_by(platform_name='YouTube').first()
-                if not platform:
-                    platform = Platform(platform_name='YouTube', api_details='{"api_url": "https://www.youtube.com", "version": "v3"}')
-                    db.session.add(platform)
-                    db.session.commit()
+                platform = ensure_platform('YouTube', '{"api_url": "https://www.youtube.com", "version": "v3"}')
                 
                 # Generate a unique state parameter for this user's OAuth flow
                 import secrets
@@ -2142,27 +3118,15 @@ def connect_platform():
     
     # GET request - show available platforms
     # Ensure platforms exist in database
-    spotify_platform = Platform.query.filter_by(platform_name='Spotify').first()
-    if not spotify_platform:
-        spotify_platform = Platform(platform_name='Spotify', api_details='{"api_url": "https://api.spotify.com"}')
-        db.session.add(spotify_platform)
+    ensure_platform('Spotify', '{"api_url": "https://api.spotify.com"}')
+    ensure_platform('YouTube', '{"api_url": "https://www.youtube.com"}')
     
-    youtube_platform = Platform.query.filter_by(platform_name='YouTube').first()
-    if not youtube_platform:
-        youtube_platform = Platform(platform_name='YouTube', api_details='{"api_url": "https://www.youtube.com"}')
-        db.session.add(youtube_platform)
-    
-    db.session.commit()
-    
-    # Get all platforms and user accounts
-    all_platforms = Platform.query.all()
-    user_accounts = UserPlatformAccount.query.filter_by(user_id=current_user.user_id).all()
+    # Get all platforms (from the platform cache) and user accounts
+    all_platforms = get_all_platforms()
+    user_accounts = UserPlatformAccount.query.options(joinedload(UserPlatformAccount.platform)).filter_by(user_id=current_user.user_id).all()
     
     # Create a mapping of platform_id to user account for quick lookup
-    account_by_platform = {}
-    for account in user_accounts:
-        account.platform = db.session.get(Platform, account.platform_id)
-        account_by_platform[account.platform_id] = account
+    account_by_platform = {account.platform_id: account for account in user_accounts}
     
     # Create platforms data structure with connection status
     platforms = []
@@ -2217,32 +3181,17 @@ def spotify_callback():
         session.pop('spotify_user_info', None)
         print(f" Cleared existing Spotify session data for user {current_user.user_id}")
         
-        # Clear any existing Spotify cache files to prevent token contamination
-        import os
-        cache_file = f".spotify_cache_user_{current_user.user_id}.cache"
-        if os.path.exists(cache_file):
-            os.remove(cache_file)
-            print(f"🗑️ Cleared existing Spotify cache file for user {current_user.user_id}")
-        
         # Exchange code for access token
         print(f"Spotify OAuth config - Client ID: {SPOTIFY_CLIENT_ID[:10]}...")
         print(f"Spotify OAuth config - Redirect URI: {SPOTIFY_REDIRECT_URI}")
         print(f"🔐 Processing Spotify callback for user: {current_user.user_id}")
         
-        spotify_oauth = SpotifyOAuth(
-            client_id=SPOTIFY_CLIENT_ID,
-            client_secret=SPOTIFY_CLIENT_SECRET,
-            redirect_uri=SPOTIFY_REDIRECT_URI,
-            scope='playlist-read-private playlist-read-collaborative user-read-private playlist-modify-public playlist-modify-private',
-            cache_path=f".spotify_cache_user_{current_user.user_id}.cache"
-        )
-        
-        token_info = spotify_oauth.get_access_token(code)
+        token_info = make_spotify_oauth().get_access_token(code)
         access_token = token_info['access_token']
         print(f"Spotify access token obtained: {access_token[:20]}...")
         
         # Get user info from Spotify with error handling
-        sp = spotipy.Spotify(auth=access_token)
+        sp = spotify_client(access_token)
         try:
             user_info = sp.current_user()
             print(f"Spotify callback - user info: {user_info}")
@@ -2256,11 +3205,7 @@ def spotify_callback():
             return redirect(url_for('dashboard'))
         
         # Get or create platform
-        platform = Platform.query.filter_by(platform_name='Spotify').first()
-        if not platform:
-            platform = Platform(platform_name='Spotify', api_details='{"api_url": "https://api.spotify.com"}')
-            db.session.add(platform)
-            db.session.commit()
+        platform = ensure_platform('Spotify', '{"api_url": "https://api.spotify.com"}')
         
         # Get Spotify username
         spotify_username = user_info.get('display_name') or user_info.get('id', f"user_{current_user.user_id}")
@@ -2323,8 +3268,6 @@ def youtube_callback():
         print(f" Validated YouTube OAuth state for user {current_user.user_id}")
         
         # Exchange code for access token
-        import requests
-        
         token_data = {
             'client_id': YOUTUBE_CLIENT_ID,
             'client_secret': YOUTUBE_CLIENT_SECRET,
@@ -2333,7 +3276,7 @@ def youtube_callback():
             'redirect_uri': YOUTUBE_REDIRECT_URI
         }
         
-        token_response = requests.post('https://oauth2.googleapis.com/token', data=token_data)
+        token_response = http_session.post('https://oauth2.googleapis.com/token', data=token_data)
         token_json = token_response.json()
         
         if 'access_token' not in token_json:
@@ -2344,7 +3287,7 @@ def youtube_callback():
         
         # Get YouTube channel info
         headers = {'Authorization': f'Bearer {access_token}'}
-        channel_response = requests.get(
+        channel_response = http_session.get(
             'https://www.googleapis.com/youtube/v3/channels?part=snippet&mine=true',
             headers=headers
         )
@@ -2376,13 +3319,7 @@ def youtube_callback():
         # Use separate transactions to avoid locks
         try:
             # First transaction: Ensure platform exists
-            platform = Platform.query.filter_by(platform_name='YouTube').first()
-            if not platform:
-                platform = Platform(platform_name='YouTube', api_details='{"api_url": "https://www.youtube.com", "version": "v3"}')
-                db.session.add(platform)
-                db.session.commit()
-                # Reload platform to get fresh object
-                platform = Platform.query.filter_by(platform_name='YouTube').first()
+            platform = ensure_platform('YouTube', '{"api_url": "https://www.youtube.com", "version": "v3"}')
             
             # Second transaction: Handle account creation/update
             # Start fresh session to avoid conflicts
@@ -2453,7 +3390,7 @@ def logs():
     """View sync logs"""
     try:
         # Get sync logs - admins see all logs, users see only their own
-        if hasattr(current_user, 'admin_id'):
+        if current_user.is_admin:
             # Admin can see all sync logs
             sync_logs = SyncLog.query.order_by(SyncLog.timestamp.desc()).all()
         else:
@@ -2496,16 +3433,15 @@ def logs():
 def profile():
     """User profile page"""
     # Check if current user is admin - redirect to admin dashboard
-    if hasattr(current_user, 'admin_id'):
+    if current_user.is_admin:
         return redirect(url_for('admin_dashboard'))
-    user_accounts = UserPlatformAccount.query.filter_by(user_id=current_user.user_id).filter(UserPlatformAccount.auth_token.isnot(None)).all()
-    
-    # Add platform info to accounts
-    for account in user_accounts:
-        account.platform = db.session.get(Platform, account.platform_id)
+    # Connected accounts - platform names come from the cached platform list below
+    user_accounts = UserPlatformAccount.query.filter_by(
+        user_id=current_user.user_id
+    ).filter(UserPlatformAccount.auth_token.isnot(None)).all()
     
     # Create platforms data structure that the template expects
-    all_platforms = Platform.query.all()
+    all_platforms = get_all_platforms()
     platforms = []
     
     for platform in all_platforms:
@@ -2527,26 +3463,36 @@ def profile():
 def disconnect_platform(account_id):
     """Disconnect a platform account"""
     try:
-        account = UserPlatformAccount.query.get_or_404(account_id)
-        
-        # Verify ownership
-        if account.user_id != current_user.user_id:
+        # Fetch the account and verify ownership in the same query
+        account = UserPlatformAccount.query.filter_by(
+            account_id=account_id,
+            user_id=current_user.user_id
+        ).first()
+        if not account:
             flash('Access denied')
             return redirect(url_for('profile'))
         
         # Get platform name for message
-        platform = db.session.get(Platform, account.platform_id)
+        platform = get_platform(account.platform_id)
         platform_name = platform.platform_name if platform else 'Unknown'
         
-        # Delete associated playlists and their relationships
-        playlists = Playlist.query.filter_by(account_id=account_id).all()
-        for playlist in playlists:
-            PlaylistSong.query.filter_by(playlist_id=playlist.playlist_id).delete()
-            db.session.delete(playlist)
+        # Delete associated playlists and their relationships - one DELETE statement each
+        PlaylistSong.query.filter(PlaylistSong.playlist_id.in_(
+            db.select(Playlist.playlist_id).where(Playlist.account_id == account_id)
+        )).delete(synchronize_session=False)
+        Playlist.query.filter_by(account_id=account_id).delete(synchronize_session=False)
+        
+        # Sync logs whose cached sync_details responses reference the account
+        affected_sync_ids = db.session.scalars(db.select(SyncLog.sync_id).where(
+            SyncLog.user_id == current_user.user_id,
+            db.or_(SyncLog.source_account_id == account_id, SyncLog.destination_account_id == account_id)
+        )).all()
         
         # Delete the account
         db.session.delete(account)
         db.session.commit()
+        cache.delete_many(*[sync_details_cache_key(sync_id, current_user.is_admin, current_user.get_id())
+                            for sync_id in affected_sync_ids])
         
         flash(f'{platform_name} account disconnected successfully')
         
@@ -2564,7 +3510,7 @@ def refresh_playlists():
         user_accounts = UserPlatformAccount.query.filter_by(user_id=current_user.user_id).all()
         
         for account in user_accounts:
-            platform = db.session.get(Platform, account.platform_id)
+            platform = get_platform(account.platform_id)
             
             if platform.platform_name == 'Spotify' and account.auth_token:
                 fetch_spotify_playlists(current_user.user_id, account.auth_token)
@@ -2583,20 +3529,22 @@ def refresh_playlists():
 def playlist_details(playlist_id):
     """View playlist details"""
     try:
-        playlist = Playlist.query.get_or_404(playlist_id)
-        
-        # Verify ownership
-        account = db.session.get(UserPlatformAccount, playlist.account_id)
-        if account.user_id != current_user.user_id:
+        # Fetch the playlist and verify ownership in the same query
+        row = get_owned_playlist(playlist_id)
+        if not row:
             flash('Access denied')
             return redirect(url_for('dashboard'))
+        playlist, account = row
         
         # Get playlist songs
         playlist_songs = PlaylistSong.query.filter_by(playlist_id=playlist.playlist_id).all()
         
+        # Fetch all songs of the playlist with one IN query
+        songs_by_id = fetch_songs_by_id([ps.song_id for ps in playlist_songs])
+        
         songs = []
         for ps in playlist_songs:
-            song = db.session.get(Song, ps.song_id)
+            song = songs_by_id.get(ps.song_id)
             if song:
                 songs.append({
                     'song_id': song.song_id,
@@ -2608,7 +3556,7 @@ def playlist_details(playlist_id):
                 })
         
         # Get platform info
-        platform = db.session.get(Platform, account.platform_id)
+        platform = get_platform(account.platform_id)
         
         # Get other playlists for syncing
         other_playlists = []
@@ -2617,7 +3565,7 @@ def playlist_details(playlist_id):
             account_playlists = Playlist.query.filter_by(account_id=user_account.account_id).all()
             for other_playlist in account_playlists:
                 if other_playlist.playlist_id != playlist.playlist_id:
-                    other_playlist.platform = db.session.get(Platform, user_account.platform_id)
+                    other_playlist.platform = get_platform(user_account.platform_id)
                     other_playlists.append(other_playlist)
         
         return render_template('playlist_details.html', 
@@ -2635,7 +3583,7 @@ def playlist_details(playlist_id):
 def debug_logs():
     """View debug logs for troubleshooting"""
     try:
-        with open('/tmp/sync_debug.log', 'r') as f:
+        with open(SYNC_DEBUG_LOG_PATH, 'r') as f:
             logs = f.read()
         return f"""
         <html>
@@ -2665,10 +3613,9 @@ def test_debug():
     """Test debug logging"""
     try:
         # Test file logging
-        with open('/tmp/sync_debug.log', 'a') as f:
-            f.write(f"=== TEST DEBUG {datetime.now()} ===\n")
-            f.write(f"User: {current_user.email if hasattr(current_user, 'email') else 'Unknown'}\n")
-            f.write(f"Test successful!\n")
+        sync_debug_log.debug("=== TEST DEBUG %s ===", datetime.now())
+        sync_debug_log.debug("User: %s", current_user.email if hasattr(current_user, 'email') else 'Unknown')
+        sync_debug_log.debug("Test successful!")
         
         return f"Debug test successful! Check /debug_logs to see the log entry."
     except Exception as e:
@@ -2682,22 +3629,26 @@ def cleanup_logs():
         # Delete logs older than 30 days
         cutoff_date = datetime.now().date() - timedelta(days=30)
         
-        if hasattr(current_user, 'admin_id'):
-            # Admin can clean all logs
-            old_logs = SyncLog.query.filter(SyncLog.timestamp < cutoff_date).all()
-        else:
-            # Users can only clean their own logs
-            old_logs = SyncLog.query.filter(
-                SyncLog.user_id == current_user.user_id,
-                SyncLog.timestamp < cutoff_date
-            ).all()
+        filters = [SyncLog.timestamp < cutoff_date]
+        if not current_user.is_admin:
+            # Users can only clean their own logs (admin can clean all logs)
+            filters.append(SyncLog.user_id == current_user.user_id)
+        old_logs = SyncLog.query.filter(*filters)
         
-        count = len(old_logs)
+        # Remember whose cached sync_details responses to drop once the logs are gone
+        deleted_logs = db.session.execute(db.select(SyncLog.sync_id, SyncLog.user_id).where(*filters)).all()
         
-        for log in old_logs:
-            db.session.delete(log)
+        # Delete the synced song records first, then the logs - one DELETE statement each
+        old_sync_ids = db.select(SyncLog.sync_id).where(*filters)
+        SyncSong.query.filter(SyncSong.sync_id.in_(old_sync_ids)).delete(synchronize_session=False)
+        count = old_logs.delete(synchronize_session=False)
         
         db.session.commit()
+        # Owners' entries are deleted by key; other admins' entries fail the existence check in sync_details
+        stale_keys = [sync_details_cache_key(sync_id, False, user_id) for sync_id, user_id in deleted_logs]
+        if current_user.is_admin:
+            stale_keys += [sync_details_cache_key(sync_id, True, current_user.get_id()) for sync_id, _ in deleted_logs]
+        cache.delete_many(*stale_keys)
         flash(f'Cleaned up {count} old log entries')
         
     except Exception as e:
@@ -2710,6 +3661,10 @@ def cleanup_logs():
 @login_required
 def sync_playlist_songs():
     """Sync selected songs from one playlist to another"""
+    # Capture the request time once - every row written by this sync shares it
+    sync_time = datetime.now()
+    sync_date = sync_time.date()
+    
     print("=== SYNC_PLAYLIST_SONGS CALLED ===")
     print(f"Source playlist ID: {request.form.get('source_playlist_id')}")
     print(f"Target playlist ID: {request.form.get('target_playlist_id')}")
@@ -2717,11 +3672,10 @@ def sync_playlist_songs():
     
     # Immediate file logging
     try:
-        with open('/tmp/sync_debug.log', 'a') as f:
-            f.write(f"=== SYNC_PLAYLIST_SONGS CALLED {datetime.now()} ===\n")
-            f.write(f"Source playlist ID: {request.form.get('source_playlist_id')}\n")
-            f.write(f"Target playlist ID: {request.form.get('target_playlist_id')}\n")
-            f.write(f"Song IDs: {request.form.getlist('song_ids')}\n")
+        sync_debug_log.debug("=== SYNC_PLAYLIST_SONGS CALLED %s ===", sync_time)
+        sync_debug_log.debug("Source playlist ID: %s", request.form.get('source_playlist_id'))
+        sync_debug_log.debug("Target playlist ID: %s", request.form.get('target_playlist_id'))
+        sync_debug_log.debug("Song IDs: %s", request.form.getlist('song_ids'))
     except Exception as e:
         print(f"File logging error: {e}")
     
@@ -2731,74 +3685,46 @@ def sync_playlist_songs():
         song_ids = request.form.getlist('song_ids')
         
         # Log validation step
-        with open('/tmp/sync_debug.log', 'a') as f:
-            f.write(f"Validation step - Source: {source_playlist_id}, Target: {target_playlist_id}, Songs: {song_ids}\n")
+        sync_debug_log.debug("Validation step - Source: %s, Target: %s, Songs: %s", source_playlist_id, target_playlist_id, song_ids)
         
         if not source_playlist_id or not target_playlist_id or not song_ids:
-            with open('/tmp/sync_debug.log', 'a') as f:
-                f.write("ERROR: Missing required parameters\n")
+            sync_debug_log.debug("ERROR: Missing required parameters")
             flash('Please select source playlist, target playlist, and songs to sync.')
             return redirect(url_for('dashboard'))
         
         # Log validation passed
-        with open('/tmp/sync_debug.log', 'a') as f:
-            f.write("Validation passed - proceeding with sync\n")
-        
-        # Verify ownership of both playlists
-        with open('/tmp/sync_debug.log', 'a') as f:
-            f.write("Fetching playlists from database\n")
-        
-        source_playlist = Playlist.query.get_or_404(source_playlist_id)
-        target_playlist = Playlist.query.get_or_404(target_playlist_id)
-        
-        with open('/tmp/sync_debug.log', 'a') as f:
-            f.write(f"Source playlist: {source_playlist.name}, Target playlist: {target_playlist.name}\n")
-        
-        with open('/tmp/sync_debug.log', 'a') as f:
-            f.write("Looking up user account\n")
-        
-        user_account = UserPlatformAccount.query.filter_by(
-            user_id=current_user.user_id,
-            account_id=source_playlist.account_id
-        ).first()
+        sync_debug_log.debug("Validation passed - proceeding with sync")
         
-        with open('/tmp/sync_debug.log', 'a') as f:
-            f.write(f"User account found: {user_account is not None}\n")
-            if user_account:
-                f.write(f"Source account ID: {source_playlist.account_id}, Target account ID: {target_playlist.account_id}\n")
-                f.write(f"User account ID: {user_account.account_id}\n")
+        # Verify ownership of both playlists - each playlist is fetched together with its
+        # platform account, restricted to the current user, in a single query
+        sync_debug_log.debug("Fetching playlists from database")
         
-        if not user_account:
-            with open('/tmp/sync_debug.log', 'a') as f:
-                f.write("ERROR: No user account found for source playlist\n")
+        source_row = get_owned_playlist(source_playlist_id)
+        if not source_row:
+            sync_debug_log.debug("ERROR: No user account found for source playlist")
             flash('You do not have access to the source playlist.')
             return redirect(url_for('dashboard'))
+        source_playlist, user_account = source_row
         
         # For cross-platform syncing, we need to get the target platform account
-        target_user_account = UserPlatformAccount.query.filter_by(
-            user_id=current_user.user_id,
-            account_id=target_playlist.account_id
-        ).first()
-        
-        
-        with open('/tmp/sync_debug.log', 'a') as f:
-            f.write(f"Target user account found: {target_user_account is not None}\n")
-        
-        if not target_user_account:
-            with open('/tmp/sync_debug.log', 'a') as f:
-                f.write("ERROR: No user account found for target playlist\n")
+        target_row = get_owned_playlist(target_playlist_id)
+        if not target_row:
+            sync_debug_log.debug("ERROR: No user account found for target playlist")
             flash('You do not have access to the target playlist.')
             return redirect(url_for('dashboard'))
+        target_playlist, target_user_account = target_row
+        
+        sync_debug_log.debug("Source playlist: %s, Target playlist: %s", source_playlist.name, target_playlist.name)
+        sync_debug_log.debug("Source account ID: %s, Target account ID: %s", user_account.account_id, target_user_account.account_id)
         
         # Get platform info for the target platform
-        platform = db.session.get(Platform, target_user_account.platform_id)
+        platform = get_platform(target_user_account.platform_id)
         
         # Get source playlist platform info
-        source_platform = db.session.get(Platform, user_account.platform_id)
+        source_platform = get_platform(user_account.platform_id)
         
-        with open('/tmp/sync_debug.log', 'a') as f:
-            f.write(f"Target platform: {platform.platform_name if platform else 'None'}\n")
-            f.write(f"Source platform: {source_platform.platform_name if source_platform else 'None'}\n")
+        sync_debug_log.debug("Target platform: %s", platform.platform_name if platform else 'None')
+        sync_debug_log.debug("Source platform: %s", source_platform.platform_name if source_platform else 'None')
         
         # Sync songs to database first
         songs_added = 0
@@ -2806,81 +3732,39 @@ def sync_playlist_songs():
         songs_not_found = 0  # Track songs that don't exist in database
         songs_to_add_to_platform = []
         synced_song_ids = []  # Track which songs were actually synced
+        youtube_songs_to_parse = []  # YouTube songs waiting for title extraction
+        
+        # Syncing from YouTube to another platform needs title extraction (hybrid approach);
+        # every other combination uses the stored song data as-is
+        parse_youtube_titles = source_platform.platform_name == 'YouTube' and platform.platform_name != 'YouTube'
+        source_platform_id = source_platform.platform_id
+        
+        # Fetch all selected songs with one IN query
+        songs_by_id = fetch_songs_by_id([int(song_id) for song_id in song_ids])
         
         for song_id in song_ids:
-            song = db.session.get(Song, song_id)
+            song = songs_by_id.get(int(song_id))
             if song:
-                # Always add to database (PlaylistSong table) - this tracks our sync history
-                existing = PlaylistSong.query.filter_by(
-                    playlist_id=target_playlist.playlist_id,
-                    song_id=song.song_id
-                ).first()
-                
                 # Always prepare for platform API call (regardless of database status)
                 # This ensures songs are added to the actual Spotify playlist even if they exist in our database
-                
-                # Add to database if not already there
-                if not existing:
-                    playlist_song = PlaylistSong(
-                        playlist_id=target_playlist.playlist_id,
-                        song_id=song.song_id,
-                        added_at=datetime.now().date()
-                    )
-                    db.session.add(playlist_song)
-                
+                # PlaylistSong rows are written in one INSERT ... ON CONFLICT DO NOTHING after the loop
+
                 # Always count as processed (whether new or existing)
                 songs_added += 1
                 synced_song_ids.append(song.song_id)  # Track this synced song
                 
                 # If syncing from YouTube to another platform, use hybrid approach
-                if source_platform.platform_name == 'YouTube' and platform.platform_name != 'YouTube':
+                if parse_youtube_titles:
                     # Get the original YouTube title from the platform song mapping
                     platform_song = PlatformSong.query.filter_by(
                         song_id=song.song_id,
-                        platform_id=source_platform.platform_id
+                        platform_id=source_platform_id
                     ).first()
                     
                     if platform_song:
                         # For YouTube songs, the title is already the original YouTube title
-                        original_title = song.title  # Title is now the original YouTube title
-                        video_id = platform_song.platform_specific_id
-                        print(f"Processing YouTube title: '{original_title}'")
-                            
-                        # Use hybrid parsing approach (NEW EXTRACTION SYSTEM)
-                        hybrid_result = hybrid_song_parsing(original_title, song.artist, video_id, target_user_account.auth_token)
-                            
-                        if hybrid_result['success']:
-                            # Success - add to platform
-                            print(f"✅ Hybrid parsing successful: {hybrid_result['song_name']} by {hybrid_result['artist_name']} (method: {hybrid_result['method']})")
-                            
-                            songs_to_add_to_platform.append({
-                                'title': hybrid_result['song_name'],
-                                'artist': hybrid_result['artist_name'],
-                                'album': hybrid_result['album_name'],
-                                'original_title': original_title,
-                                'duration': song.duration,
-                                'gemini_confidence': hybrid_result['confidence'],
-                                'channel_name': song.artist,
-                                'source': hybrid_result['method'],
-                                'spotify_track': hybrid_result.get('spotify_track'),
-                                'fallback_results': hybrid_result.get('fallback_results', [])
-                            })
-                        else:
-                            # Manual selection required
-                            print(f"⚠️ Manual selection required for: {hybrid_result['song_name']} by {hybrid_result['artist_name']}")
-                            
-                            songs_to_add_to_platform.append({
-                                'title': hybrid_result['song_name'],
-                                'artist': hybrid_result['artist_name'],
-                                'album': hybrid_result['album_name'],
-                                'original_title': original_title,
-                                'duration': song.duration,
-                                'gemini_confidence': 0.0,
-                                'channel_name': song.artist,
-                                'source': 'manual_selection',
-                                'spotify_track': None,
-                                'fallback_results': hybrid_result.get('fallback_results', [])
-                            })
+                        # Extraction hits external APIs, so it runs in a thread pool after this loop
+                        youtube_songs_to_parse.append((song.title, song.artist, platform_song.platform_specific_id, song.duration))
                 else:
                     # For other sync types, use original song data
                     songs_to_add_to_platform.append({
@@ -2889,23 +3773,62 @@ def sync_playlist_songs():
                         'album': song.album,
                         'duration': song.duration
                     })
-                    
-                    # Commit database changes for this song
-                    db.session.commit()
             else:
                 # Song doesn't exist in database - this shouldn't happen in normal operation
                 print(f"Warning: Song ID {song_id} not found in database - skipping this song")
                 songs_not_found += 1
                 # Skip this song and continue with the next one
                 continue
-        
+
+        # Only titles that both YouTube Music and the regex parser miss reach the AI step. Run the
+        # YouTube Music lookups for the titles the regex cannot parse first (memoized, so the
+        # extraction below reuses them), then resolve just the leftovers in a few batched Gemini
+        # calls so the per-title AI step is served from cache
+        if youtube_songs_to_parse and GEMINI_API_KEY:
+            unparsed_titles = [
+                original_title for original_title, _, _, _ in youtube_songs_to_parse
+                if clean_title_regex(original_title) is None
+            ]
+            if unparsed_titles:
+                with ThreadPoolExecutor(max_workers=ENRICHMENT_MAX_WORKERS) as executor:
+                    ytmusic_results = list(executor.map(get_from_ytmusic, unparsed_titles))
+                ai_extract_songs_batch([
+                    original_title for original_title, ytmusic_result in zip(unparsed_titles, ytmusic_results)
+                    if ytmusic_result is None
+                ])
+
+        # Run the YouTube title extraction (YouTube Music / Gemini / Groq lookups) for all songs in parallel.
+        # Each worker gets its own copy of the request context because the AI step keys the Gemini
+        # quota flag on current_user, which is only resolvable inside a request context.
+        if youtube_songs_to_parse:
+            with ThreadPoolExecutor(max_workers=ENRICHMENT_MAX_WORKERS) as executor:
+                futures = [
+                    executor.submit(
+                        copy_current_request_context(build_youtube_song_info),
+                        original_title, channel_name, video_id, duration, target_user_account.auth_token
+                    )
+                    for original_title, channel_name, video_id, duration in youtube_songs_to_parse
+                ]
+                songs_to_add_to_platform.extend(future.result() for future in futures)
+
+        # Add all synced songs to the target playlist (PlaylistSong table) in a single statement -
+        # the database skips songs that are already in the playlist
+        if synced_song_ids:
+            insert_ignore_duplicates(
+                PlaylistSong,
+                [{'playlist_id': target_playlist.playlist_id, 'song_id': song_id, 'added_at': sync_date}
+                 for song_id in dict.fromkeys(synced_song_ids)],
+                index_elements=['playlist_id', 'song_id']
+            )
+            db.session.commit()
+
         # After processing all songs, separate songs that need manual selection from songs ready to be added
         songs_ready_for_platform = []
         pending_tracks = []
         
         for song_info in songs_to_add_to_platform:
             if song_info.get('source') in ['manual_selection', 'ai_comparison']:
-                # Store for manual selection or AI comparison (minimal data to avoid session cookie size issues)
+                # Store for manual selection or AI comparison (minimal data to keep the stored session small)
                 pending_tracks.append({
                     'song_info': {
                         'title': song_info.get('title'),
@@ -2927,23 +3850,18 @@ def sync_playlist_songs():
         
         # Store pending tracks in session (user-specific)
         if pending_tracks:
-            user_pending_key = f'pending_tracks_{current_user.user_id}'
-            if user_pending_key not in session:
-                session[user_pending_key] = []
-            session[user_pending_key].extend(pending_tracks)
-            session.modified = True
+            save_pending_tracks(get_pending_tracks() + pending_tracks)
         
         # Try to update the real platform playlist (only for songs ready to be added)
         platform_songs_added = 0
         # Log to file for better debugging
-        with open('/tmp/sync_debug.log', 'a') as f:
-            f.write(f"=== SYNC DEBUG START ===\n")
-            f.write(f"Sync debug - Platform: {platform.platform_name if platform else 'None'}\n")
-            f.write(f"Sync debug - Target account token: {'Present' if target_user_account.auth_token else 'Missing'}\n")
-            f.write(f"Songs ready for platform: {len(songs_ready_for_platform)}\n")
-            f.write(f"Songs requiring manual selection: {len(pending_tracks)}\n")
-            f.write(f"Target playlist: {target_playlist.name if target_playlist else 'None'}\n")
-            f.write(f"Target playlist platform ID: {target_playlist.platform_playlist_id if target_playlist else 'None'}\n")
+        sync_debug_log.debug("=== SYNC DEBUG START ===")
+        sync_debug_log.debug("Sync debug - Platform: %s", platform.platform_name if platform else 'None')
+        sync_debug_log.debug("Sync debug - Target account token: %s", 'Present' if target_user_account.auth_token else 'Missing')
+        sync_debug_log.debug("Songs ready for platform: %s", len(songs_ready_for_platform))
+        sync_debug_log.debug("Songs requiring manual selection: %s", len(pending_tracks))
+        sync_debug_log.debug("Target playlist: %s", target_playlist.name if target_playlist else 'None')
+        sync_debug_log.debug("Target playlist platform ID: %s", target_playlist.platform_playlist_id if target_playlist else 'None')
         
         if platform and target_user_account.auth_token and songs_ready_for_platform:
             if platform.platform_name == 'YouTube':
@@ -2968,29 +3886,27 @@ def sync_playlist_songs():
             total_songs_synced=songs_added,
             songs_added=platform_songs_added,  # Only count songs actually added to platform
             songs_removed=0,
-            timestamp=datetime.now().date()
+            timestamp=sync_date
         )
         db.session.add(sync_log)
-        db.session.commit()
+        db.session.flush()  # Get the sync_id - the log and its SyncSong rows are committed together
         
         # Store the sync log ID for reference
         sync_log_id = sync_log.sync_id
         
-        # Record exactly which songs were synced
-        for song_id in synced_song_ids:
-            sync_song = SyncSong(
-                sync_id=sync_log_id,
-                song_id=song_id,
-                action='added',
-                timestamp=datetime.now()
+        # Record exactly which songs were synced (one executemany INSERT, no ORM objects)
+        if synced_song_ids:
+            db.session.execute(
+                SyncSong.__table__.insert(),
+                [{'sync_id': sync_log_id, 'song_id': song_id, 'action': 'added', 'timestamp': sync_time}
+                 for song_id in dict.fromkeys(synced_song_ids)]
             )
-            db.session.add(sync_song)
         
         db.session.commit()
         
         # User feedback
         # Check if there are pending tracks for user confirmation
-        pending_tracks = session.get(f'pending_tracks_{current_user.user_id}', [])
+        pending_tracks = get_pending_tracks()
         
         # Show comprehensive sync results
         messages = []
@@ -3032,7 +3948,7 @@ def sync_playlist_songs():
 def confirm_fallback_tracks():
     """Show fallback tracks for user confirmation"""
     try:
-        pending_tracks = session.get(f'pending_tracks_{current_user.user_id}', [])
+        pending_tracks = get_pending_tracks()
         
         if not pending_tracks:
             flash('No pending tracks to confirm.')
@@ -3059,7 +3975,7 @@ def confirm_ai_result():
         track_index = int(request.form.get('track_index'))
         ai_choice = request.form.get('ai_choice')  # 'gemini' or 'groq'
         
-        pending_tracks = session.get(f'pending_tracks_{current_user.user_id}', [])
+        pending_tracks = get_pending_tracks()
         if track_index >= len(pending_tracks):
             flash('Invalid track selection.')
             return redirect(url_for('confirm_fallback_tracks'))
@@ -3083,7 +3999,7 @@ def confirm_ai_result():
         # Search Spotify for the AI result
         try:
             # Get user's Spotify account
-            platform = Platform.query.filter_by(platform_name='Spotify').first()
+            platform = get_platform_by_name('Spotify')
             if not platform:
                 flash('Spotify platform not found.')
                 return redirect(url_for('confirm_fallback_tracks'))
@@ -3098,9 +4014,9 @@ def confirm_ai_result():
                 return redirect(url_for('confirm_fallback_tracks'))
             
             # Search Spotify for the AI result
-            sp = spotipy.Spotify(auth=user_account.auth_token)
+            sp = spotify_client(user_account.auth_token)
             search_query = f'track:"{selected_result["song_name"]}" artist:"{selected_result["artist_name"]}"'
-            results = sp.search(q=search_query, type='track', limit=1)
+            results = search_spotify_tracks(sp, search_query)
             
             if results['tracks']['items']:
                 spotify_track = results['tracks']['items'][0]
@@ -3110,8 +4026,7 @@ def confirm_ai_result():
                 
                 # Remove this track from pending tracks
                 pending_tracks.pop(track_index)
-                session[f'pending_tracks_{current_user.user_id}'] = pending_tracks
-                session.modified = True
+                save_pending_tracks(pending_tracks)
                 
                 flash(f'Successfully added "{spotify_track["name"]}" by {spotify_track["artists"][0]["name"]} to your playlist!')
             else:
@@ -3137,7 +4052,7 @@ def confirm_track():
     try:
         track_index = int(request.form.get('track_index'))
         
-        pending_tracks = session.get(f'pending_tracks_{current_user.user_id}', [])
+        pending_tracks = get_pending_tracks()
         if track_index >= len(pending_tracks):
             flash('Invalid track selection.')
             return redirect(url_for('confirm_fallback_tracks'))
@@ -3159,7 +4074,7 @@ def confirm_track():
         # Add the selected track to Spotify playlist
         try:
             # Get user's Spotify account
-            platform = Platform.query.filter_by(platform_name='Spotify').first()
+            platform = get_platform_by_name('Spotify')
             if not platform:
                 flash('Spotify platform not found.')
                 return redirect(url_for('confirm_fallback_tracks'))
@@ -3174,24 +4089,21 @@ def confirm_track():
                 return redirect(url_for('confirm_fallback_tracks'))
             
             # Add track to playlist
-            sp = spotipy.Spotify(auth=user_account.auth_token)
+            sp = spotify_client(user_account.auth_token)
             sp.playlist_add_items(playlist_id, [selected_track['uri']])
             
             # Remove this track from pending tracks
             pending_tracks.pop(track_index)
-            session[f'pending_tracks_{current_user.user_id}'] = pending_tracks
-            session.modified = True
+            save_pending_tracks(pending_tracks)
             
             # Learning mechanism: Track exact match confirmations
             if selected_track.get('is_exact_match'):
                 exact_match_count = session.get(f'exact_match_confirmations_{current_user.user_id}', 0) + 1
                 session[f'exact_match_confirmations_{current_user.user_id}'] = exact_match_count
-                session.modified = True
                 
                 # Auto-enable after 5 exact match confirmations
                 if exact_match_count >= 5 and not session.get(f'auto_confirm_exact_matches_{current_user.user_id}'):
                     session[f'auto_confirm_exact_matches_{current_user.user_id}'] = True
-                    session.modified = True
                     flash(f"Successfully added '{selected_track['name']}' by {selected_track['artist']} to playlist! 🎉 Auto-confirm enabled for exact matches after {exact_match_count} confirmations.")
                 else:
                     flash(f"Successfully added '{selected_track['name']}' by {selected_track['artist']} to playlist!")
@@ -3199,13 +4111,11 @@ def confirm_track():
                 flash(f"Successfully added '{selected_track['name']}' by {selected_track['artist']} to playlist!")
             
             # Log success
-            with open('/tmp/sync_debug.log', 'a') as f:
-                f.write(f"User confirmed track: '{selected_track['name']}' by {selected_track['artist']} - URI: {selected_track['uri']}\n")
+            sync_debug_log.debug("User confirmed track: '%s' by %s - URI: %s", selected_track['name'], selected_track['artist'], selected_track['uri'])
             
         except Exception as e:
             flash(f'Error adding track to playlist: {str(e)}')
-            with open('/tmp/sync_debug.log', 'a') as f:
-                f.write(f"Error adding confirmed track: {str(e)}\n")
+            sync_debug_log.debug("Error adding confirmed track: %s", e)
         
         # If no more pending tracks, redirect to dashboard
         if not pending_tracks:
@@ -3224,21 +4134,19 @@ def skip_track():
     try:
         track_index = int(request.form.get('track_index'))
         
-        pending_tracks = session.get(f'pending_tracks_{current_user.user_id}', [])
+        pending_tracks = get_pending_tracks()
         if track_index >= len(pending_tracks):
             flash('Invalid track selection.')
             return redirect(url_for('confirm_fallback_tracks'))
         
         # Remove this track from pending tracks
-        pending_tracks.pop(track_index)
-        session[f'pending_tracks_{current_user.user_id}'] = pending_tracks
-        session.modified = True
+        skipped_track = pending_tracks.pop(track_index)
+        save_pending_tracks(pending_tracks)
         
         flash('Track skipped.')
         
         # Log skip
-        with open('/tmp/sync_debug.log', 'a') as f:
-            f.write(f"User skipped track: {pending_tracks[track_index]['song_info']['title']}\n")
+        sync_debug_log.debug("User skipped track: %s", skipped_track['song_info']['title'])
         
         # If no more pending tracks, redirect to dashboard
         if not pending_tracks:
@@ -3257,7 +4165,6 @@ def toggle_auto_confirm():
     try:
         auto_confirm = request.form.get('auto_confirm') == 'true'
         session[f'auto_confirm_exact_matches_{current_user.user_id}'] = auto_confirm
-        session.modified = True
         
         if auto_confirm:
             flash('Auto-confirm enabled: Exact matches will be added automatically without confirmation.')
@@ -3274,123 +4181,146 @@ def toggle_auto_confirm():
 @login_required
 def sync_cross_platform():
     """Sync entire playlist from one platform to another (e.g., YouTube to Spotify)"""
-    try:
-        source_playlist_id = request.form.get('source_playlist_id')
-        target_playlist_id = request.form.get('target_playlist_id')
-        
-        if not source_playlist_id or not target_playlist_id:
-            flash('Please select both source and target playlists.')
-            return redirect(url_for('dashboard'))
-        
-        # Get playlists
-        source_playlist = Playlist.query.get_or_404(source_playlist_id)
-        target_playlist = Playlist.query.get_or_404(target_playlist_id)
-        
-        # Verify ownership
-        source_account = UserPlatformAccount.query.filter_by(
-            user_id=current_user.user_id,
-            account_id=source_playlist.account_id
-        ).first()
-        
-        target_account = UserPlatformAccount.query.filter_by(
-            user_id=current_user.user_id,
-            account_id=target_playlist.account_id
-        ).first()
-        
-        if not source_account or not target_account:
-            flash('Access denied - you must own both playlists.')
-            return redirect(url_for('dashboard'))
-        
-        # Get platform names
-        source_platform = db.session.get(Platform, source_account.platform_id)
-        target_platform = db.session.get(Platform, target_account.platform_id)
-        
-        # Get all user accounts for cross-platform sync
-        user_accounts = UserPlatformAccount.query.filter_by(user_id=current_user.user_id).all()
-        
-        # Perform cross-platform sync
-        success, message = sync_playlist_cross_platform(
-            source_playlist, 
-            target_playlist, 
-            source_platform.platform_name, 
-            target_platform.platform_name, 
-            user_accounts
-        )
-        
-        if success:
-            flash(f'Cross-platform sync successful: {message}')
-        else:
-            flash(f'Cross-platform sync failed: {message}')
-        
-        return redirect(url_for('playlist_details', playlist_id=source_playlist_id))
-        
-    except Exception as e:
-        flash(f'Error in cross-platform sync: {str(e)}')
-        db.session.rollback()
+    source_playlist_id = request.form.get('source_playlist_id')
+    target_playlist_id = request.form.get('target_playlist_id')
+    
+    if not source_playlist_id or not target_playlist_id:
+        flash('Please select both source and target playlists.')
         return redirect(url_for('dashboard'))
+    
+    # Get playlists and verify ownership in the same query
+    source_row = get_owned_playlist(source_playlist_id)
+    target_row = get_owned_playlist(target_playlist_id)
+    
+    if not source_row or not target_row:
+        flash('Access denied - you must own both playlists.')
+        return redirect(url_for('dashboard'))
+    
+    source_playlist, source_account = source_row
+    target_playlist, target_account = target_row
+    
+    # Get platform names
+    source_platform = get_platform(source_account.platform_id)
+    target_platform = get_platform(target_account.platform_id)
+    
+    # Get all user accounts for cross-platform sync
+    user_accounts = UserPlatformAccount.query.filter_by(user_id=current_user.user_id).all()
+    
+    # Perform cross-platform sync
+    success, message = sync_playlist_cross_platform(
+        source_playlist, 
+        target_playlist, 
+        source_platform.platform_name, 
+        target_platform.platform_name, 
+        user_accounts
+    )
+    
+    if success:
+        flash(f'Cross-platform sync successful: {message}')
+    else:
+        flash(f'Cross-platform sync failed: {message}')
+    
+    return redirect(url_for('playlist_details', playlist_id=source_playlist_id))
+
+# Display labels for SyncSong.action values
+SYNC_ACTION_LABELS = {'added': 'Added', 'removed': 'Removed', 'failed': 'Failed'}
 
 @app.route('/sync_details/<int:sync_id>')
 @login_required
 def sync_details(sync_id):
     """Get detailed information about a sync operation"""
-    try:
-        sync_log = SyncLog.query.get_or_404(sync_id)
-        
-        # Verify ownership - admins can see all, users only their own
-        if not hasattr(current_user, 'admin_id') and sync_log.user_id != current_user.user_id:
-            return jsonify({'error': 'Access denied'}), 403
-        
-        # Get related data
-        source_account = db.session.get(UserPlatformAccount, sync_log.source_account_id)
-        destination_account = db.session.get(UserPlatformAccount, sync_log.destination_account_id)
-        
-        source_platform = db.session.get(Platform, source_account.platform_id) if source_account else None
-        destination_platform = db.session.get(Platform, destination_account.platform_id) if destination_account else None
-        
-        playlist = db.session.get(Playlist, sync_log.playlist_id)
-        user = db.session.get(User, sync_log.user_id)
-        
-        # Get the exact songs that were synced using the new SyncSong table
-        synced_songs = []
-        
-        # Query the SyncSong table to get the exact songs synced in this operation
-        sync_song_records = SyncSong.query.filter_by(sync_id=sync_log.sync_id).all()
-        
-        for sync_song in sync_song_records:
-            song = db.session.get(Song, sync_song.song_id)
-            if song:
-                synced_songs.append({
-                    'song_id': song.song_id,
-                    'title': song.title,
-                    'artist': song.artist,
-                    'album': song.album,
-                    'duration': song.duration,
-                    'action': sync_song.action,
-                    'note': f'{sync_song.action.title()} on {sync_song.timestamp.strftime("%Y-%m-%d %H:%M")}'
-                })
-        
-        sync_data = {
-            'sync_id': sync_log.sync_id,
-            'user_name': user.name if user else 'Unknown',
-            'source_platform': source_platform.platform_name if source_platform else 'Unknown',
-            'destination_platform': destination_platform.platform_name if destination_platform else 'Unknown',
-            'source_username': source_account.username_on_platform if source_account else 'Unknown',
-            'destination_username': destination_account.username_on_platform if destination_account else 'Unknown',
-            'playlist_name': playlist.name if playlist else 'Unknown',
-            'total_songs_synced': sync_log.total_songs_synced,
-            'songs_added': sync_log.songs_added,
-            'songs_removed': sync_log.songs_removed,
-            'timestamp': sync_log.timestamp.strftime('%Y-%m-%d'),
-            'synced_songs': synced_songs
-        }
-        
-        return jsonify({
-            'success': True,
-            'sync_data': sync_data
-        })
-        
-    except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 500
+    cache_key = sync_details_cache_key(sync_id, current_user.is_admin, current_user.get_id())
+    sync_data = cache.get(cache_key)
+    if sync_data is not None:
+        # The log may have been deleted since it was cached - check it still exists and is visible
+        visible = SyncLog.query.filter_by(sync_id=sync_id)
+        if not current_user.is_admin:
+            visible = visible.filter_by(user_id=current_user.user_id)
+        if not db.session.query(visible.exists()).scalar():
+            cache.delete(cache_key)
+            sync_data = None
+    if sync_data is None:
+        sync_data = build_sync_details(sync_id)
+        if sync_data is None:
+            return jsonify({'success': False, 'error': 'Sync not found'}), 404
+        cache.set(cache_key, sync_data, timeout=SYNC_DETAILS_CACHE_TIMEOUT)
+    
+    response = jsonify({
+        'success': True,
+        'sync_data': sync_data
+    })
+    # Let the browser revalidate with If-None-Match and get an empty 304 for an unchanged sync
+    response.set_etag(f"{sync_data['sync_id']}-{sync_data['timestamp']}")
+    response.cache_control.private = True
+    return response.make_conditional(request)
+
+def build_sync_details(sync_id):
+    """Build the sync_details payload for a sync visible to the current user, or None"""
+    # Load the log with its accounts, playlist and user in one joined query
+    query = SyncLog.query.options(
+        joinedload(SyncLog.source_account),
+        joinedload(SyncLog.destination_account),
+        joinedload(SyncLog.playlist),
+        joinedload(SyncLog.user)
+    ).filter(SyncLog.sync_id == sync_id)
+    
+    # Verify ownership in the same query - admins can see all, users only their own
+    if not current_user.is_admin:
+        query = query.filter(SyncLog.user_id == current_user.user_id)
+    
+    sync_log = query.first()
+    if not sync_log:
+        return None
+    
+    # Get related data (already loaded with the log)
+    source_account = sync_log.source_account
+    destination_account = sync_log.destination_account
+    
+    source_platform = get_platform(source_account.platform_id) if source_account else None
+    destination_platform = get_platform(destination_account.platform_id) if destination_account else None
+    
+    playlist = sync_log.playlist
+    user = sync_log.user
+    
+    # Get the exact songs that were synced using the new SyncSong table
+    # Query the SyncSong table joined with Song to get the exact songs synced in this operation in one query.
+    # Only the serialized columns are selected (plain rows, no ORM entities), streamed in batches of 200
+    # so large syncs are never fully materialized before the JSON build
+    sync_song_rows = db.session.execute(
+        db.select(
+            SyncSong.action, SyncSong.timestamp,
+            Song.song_id, Song.title, Song.artist, Song.album, Song.duration
+        ).join(Song, Song.song_id == SyncSong.song_id)
+        .where(SyncSong.sync_id == sync_log.sync_id)
+        .execution_options(yield_per=200)
+    )
+    
+    synced_songs = [{
+        'song_id': row.song_id,
+        'title': row.title,
+        'artist': row.artist,
+        'album': row.album,
+        'duration': row.duration,
+        'action': row.action,
+        'note': f"{SYNC_ACTION_LABELS.get(row.action) or row.action.title()} on {row.timestamp.isoformat(sep=' ', timespec='minutes')}"
+    } for row in sync_song_rows]
+    
+    sync_data = {
+        'sync_id': sync_log.sync_id,
+        'user_name': user.name if user else 'Unknown',
+        'source_platform': source_platform.platform_name if source_platform else 'Unknown',
+        'destination_platform': destination_platform.platform_name if destination_platform else 'Unknown',
+        'source_username': source_account.username_on_platform if source_account else 'Unknown',
+        'destination_username': destination_account.username_on_platform if destination_account else 'Unknown',
+        'playlist_name': playlist.name if playlist else 'Unknown',
+        'total_songs_synced': sync_log.total_songs_synced,
+        'songs_added': sync_log.songs_added,
+        'songs_removed': sync_log.songs_removed,
+        'timestamp': sync_log.timestamp.isoformat(),  # Date column - isoformat is YYYY-MM-DD
+        'synced_songs': synced_songs
+    }
+    
+    return sync_data
 
 @app.route('/logout')
 @login_required
@@ -3398,11 +4328,11 @@ def logout():
     """Logout user and clear platform connections"""
     try:
         # Clear platform connections for regular users (not admins)
-        if not hasattr(current_user, 'admin_id'):
-            user_accounts = UserPlatformAccount.query.filter_by(user_id=current_user.user_id).all()
-            for account in user_accounts:
-                # Clear the auth token to force re-authentication
-                account.auth_token = None
+        if not current_user.is_admin:
+            # Clear the auth tokens to force re-authentication (single bulk UPDATE)
+            UserPlatformAccount.query.filter_by(user_id=current_user.user_id).update(
+                {'auth_token': None}, synchronize_session=False
+            )
             db.session.commit()
             flash('Logged out successfully. Platform connections cleared for security.')
         else:
@@ -3425,9 +4355,15 @@ def init_db():
 
 @app.route('/update_db')
 def update_db():
-    """Update database with new tables"""
+    """Update database with new tables and indexes"""
     try:
         db.create_all()
+        
+        # create_all skips tables that already exist, so add indexes declared later explicitly
+        for model in (UserPlatformAccount, Song, PlatformSong):
+            for index in model.__table__.indexes:
+                index.create(db.engine, checkfirst=True)
+        
         return 'Database updated with new tables!'
     except Exception as e:
         return f'Error updating database: {str(e)}'
@@ -3494,7 +4430,7 @@ def debug_platforms():
         user_accounts = UserPlatformAccount.query.filter_by(user_id=current_user.user_id).all()
         account_data = []
         for account in user_accounts:
-            platform = db.session.get(Platform, account.platform_id)
+            platform = get_platform(account.platform_id)
             account_data.append({
                 'account_id': account.account_id,
                 'platform_id': account.platform_id,
@@ -3506,7 +4442,7 @@ def debug_platforms():
         # Get playlists with platform info
         playlists = []
         for account in user_accounts:
-            platform = db.session.get(Platform, account.platform_id)
+            platform = get_platform(account.platform_id)
             account_playlists = Playlist.query.filter_by(account_id=account.account_id).all()
             for playlist in account_playlists:
                 playlists.append({
@@ -3526,34 +4462,37 @@ def debug_platforms():
         return f'Debug error: {str(e)}', 500
 
 if __name__ == '__main__':
-    # Ensure SQLAlchemy uses modern syntax
-    from sqlalchemy import text
-    
     with app.app_context():
-        # Only apply SQLite optimizations if using SQLite
-        if 'sqlite' in app.config['SQLALCHEMY_DATABASE_URI']:
-            try:
-                db.engine.execute(text("PRAGMA journal_mode=WAL;"))
-                db.engine.execute(text("PRAGMA synchronous=NORMAL;"))
-                db.engine.execute(text("PRAGMA cache_size=10000;"))
-                db.engine.execute(text("PRAGMA temp_store=memory;"))
-            except Exception as e:
-                print(f"Warning: Could not set SQLite optimizations: {e}")
-        
+        # SQLite PRAGMAs are applied per connection by _sqlite_pragmas
         db.create_all()
         
-        # Create default platforms if they don't exist
-        if not Platform.query.filter_by(platform_name='Spotify').first():
+        # Load the platform lookup cache once at startup, then create default platforms if they don't exist
+        reload_platform_cache()
+        
+        if 'Spotify' not in PLATFORMS_BY_NAME:
             spotify = Platform(platform_name='Spotify', api_details='{"api_url": "https://api.spotify.com"}')
             db.session.add(spotify)
         
-        if not Platform.query.filter_by(platform_name='YouTube').first():
+        if 'YouTube' not in PLATFORMS_BY_NAME:
             youtube = Platform(platform_name='YouTube', api_details='{"api_url": "https://www.youtube.com"}')
             db.session.add(youtube)
         
-        db.session.commit()
+        if db.session.new:
+            db.session.commit()
+            reload_platform_cache()
     
     # Run with appropriate settings for environment
     port = int(os.getenv('PORT', 5000))
     debug = os.getenv('FLASK_ENV') != 'production'
+    
+    # In development, fail loudly on N+1 lazy loads (nplusone is a dev-only dependency)
+    if debug:
+        try:
+            from nplusone.ext.flask_sqlalchemy import NPlusOne
+            app.config['NPLUSONE_RAISE'] = True
+            NPlusOne(app)
+            print("SUCCESS: nplusone enabled - lazy loads will raise")
+        except ImportError:
+            print("WARNING: nplusone not installed - N+1 query detection disabled")
+    
     app.run(host='0.0.0.0', port=port, debug=debug)